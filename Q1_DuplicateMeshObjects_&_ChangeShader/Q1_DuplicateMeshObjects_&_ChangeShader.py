@@ -1,10 +1,433 @@
 import bpy, os
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from bpy.app.handlers import persistent
 
 #inputs
 object_name_override = "ImagineObject" #leave it empty as "" if override not desired
 collection_override = "ImagineCollection"
 gap_between_objects = 0.3  #ratio between 0 -1
+grid_size = (4, 4, 1)  #number of copies along X, Y and Z
+share_mesh = False  #True links every copy to one mesh instead of copying it per object
+output_mode = "OBJECTS"  #"OBJECTS", "COLLECTION_INSTANCES" or "POINTS" (geometry-nodes Instance on Points)
+prefetch_textures = False  #True reads the texture files on background threads while the grid is built
+
+# A text block starts from scratch on every run; caches that should outlive a run are kept here
+_session = bpy.app.driver_namespace.setdefault("Q1_DuplicateOnGrid", {})
+# Local bounds per mesh, keyed by datablock identity and checked against its geometry version
+_mesh_bounds = _session.setdefault("mesh_bounds", {})
+_geometry_versions = _session.setdefault("geometry_versions", {})
+# Texture directory listings, keyed by absolute path and extensions, checked against the directory mtime
+_texture_indexes = _session.setdefault("texture_indexes", {})
+# Writable RNA properties of each modifier type, read from bl_rna once
+_writable_properties = _session.setdefault("writable_properties", {})
+PREFETCH_CHUNK_SIZE = 1024*1024
+# Above this many targets copy_modifiers uses a single make_links_data call
+BULK_COPY_THRESHOLD = 100
+SKIPPED_MODIFIER_PROPERTIES = {"rna_type", "name", "type"}
+# Custom property set on every object this script creates, holding its name prefix;
+# a rerun removes only tagged objects, so anything else in the collection is left alone
+GRID_TAG = "duplicate_grid"
+
+
+# --- shared block "mesh_verts": generated from shared/mesh_verts.py by shared/sync.py, edit it there ---
+def get_local_mesh_verts(mesh):
+    # Read all vertex coordinates in one call
+    vertices = mesh.vertices
+    co = np.empty(len(vertices) * 3, dtype=np.float32)
+    vertices.foreach_get("co", co)
+    return co.reshape(-1, 3)
+# --- end of shared block "mesh_verts" ---
+
+
+def get_mesh_bounds(mesh):
+    # Local (min, max) corners of a mesh, read from the vertices once per geometry version
+    pointer = mesh.as_pointer()
+    # The vertex count guards against edits made while the handlers are not registered
+    version = (_geometry_versions.get(pointer, 0), len(mesh.vertices))
+    entry = _mesh_bounds.get(pointer)
+    if entry is None or entry[0] != version:
+        co = get_local_mesh_verts(mesh)
+        entry = (version, co.min(axis=0), co.max(axis=0))
+        _mesh_bounds[pointer] = entry
+    return entry[1], entry[2]
+
+
+@persistent
+def q1_on_depsgraph_update(scene, depsgraph):
+    for update in depsgraph.updates:
+        if not update.is_updated_geometry:
+            continue
+        data = update.id.original
+        if isinstance(data, bpy.types.Object):
+            data = data.data
+        if isinstance(data, bpy.types.Mesh):
+            pointer = data.as_pointer()
+            _geometry_versions[pointer] = _geometry_versions.get(pointer, 0) + 1
+            _mesh_bounds.pop(pointer, None)
+
+
+@persistent
+def q1_on_load_post(*args):
+    # Datablock pointers are not valid across files
+    _mesh_bounds.clear()
+    _geometry_versions.clear()
+
+
+# --- shared block "set_handler": generated from shared/set_handler.py by shared/sync.py, edit it there ---
+def set_handler(handler_list, handler):
+    # Every run of a text block defines new functions; drop the ones left by earlier runs
+    for old in [h for h in handler_list if getattr(h, "__name__", None) == handler.__name__]:
+        handler_list.remove(old)
+    handler_list.append(handler)
+# --- end of shared block "set_handler" ---
+
+
+def list_textures(directory, extensions=('.png',)):
+    # Sorted file names in directory, re-listed only when the directory changes
+    key = (os.path.abspath(directory), tuple(extensions))
+    mtime = os.stat(directory).st_mtime_ns
+    entry = _texture_indexes.get(key)
+    if entry is None or entry[0] != mtime:
+        names = sorted(f for f in os.listdir(directory) if f.lower().endswith(key[1]))
+        entry = (mtime, names)
+        _texture_indexes[key] = entry
+    return list(entry[1])
+
+
+def read_texture_file(path):
+    # Pull the file into the OS cache so the later load on the main thread does not wait on disk
+    with open(path, 'rb') as f:
+        while f.read(PREFETCH_CHUNK_SIZE):
+            pass
+    return path
+
+
+class TextureLibrary:
+    """Images of one directory, loaded into bpy.data the first time they are asked for."""
+
+    def __init__(self, directory, extensions=('.png',)):
+        self.directory = directory
+        self.extensions = extensions
+        self._images = {}
+        self._executor = None
+
+    @property
+    def names(self):
+        return list_textures(self.directory, self.extensions)
+
+    def get_image(self, name):
+        image = self._images.get(name)
+        if image is not None:
+            try:
+                image.name
+                return image
+            except ReferenceError:
+                # Removed from bpy.data since it was cached
+                pass
+        # check_existing hands back the datablock of an already loaded file
+        image = bpy.data.images.load(os.path.join(self.directory, name), check_existing=True)
+        self._images[name] = image
+        return image
+
+    def prefetch(self, names=None, max_workers=4):
+        """Read the files of names (all by default) on a thread pool and return the futures.
+
+        Only file reads happen off the main thread; bpy is not thread safe,
+        so get_image still creates the datablocks.
+        """
+        if names is None:
+            names = self.names
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        return [self._executor.submit(read_texture_file, os.path.join(self.directory, name)) for name in names]
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+def get_writable_properties(mod):
+    properties = _writable_properties.get(mod.type)
+    if properties is None:
+        properties = [p.identifier for p in mod.bl_rna.properties
+                      if not p.is_readonly and p.type != 'COLLECTION' and p.identifier not in SKIPPED_MODIFIER_PROPERTIES]
+        _writable_properties[mod.type] = properties
+    return properties
+
+
+def copy_modifier(mod, target):
+    new_mod = target.modifiers.new(name=mod.name, type=mod.type)
+    for identifier in get_writable_properties(mod):
+        try:
+            setattr(new_mod, identifier, getattr(mod, identifier))
+        except (AttributeError, TypeError, ValueError):
+            # A few properties only accept values valid for the target, e.g. a vertex group name
+            pass
+    if mod.type == 'NODES':
+        # Geometry node inputs are ID properties on the modifier, not RNA properties
+        for key in mod.keys():
+            new_mod[key] = mod[key]
+    return new_mod
+
+
+def link_modifiers(source, targets, context):
+    # make_links_data replaces the targets' stacks with copies of the active object's stack
+    view_layer = context.view_layer
+    previous_selection = list(context.selected_objects)
+    previous_active = view_layer.objects.active
+    for ob in previous_selection:
+        ob.select_set(False)
+    for ob in targets:
+        ob.select_set(True)
+    source.select_set(True)
+    view_layer.objects.active = source
+    try:
+        bpy.ops.object.make_links_data(type='MODIFIERS')
+    finally:
+        for ob in targets:
+            ob.select_set(False)
+        source.select_set(False)
+        for ob in previous_selection:
+            ob.select_set(True)
+        view_layer.objects.active = previous_active
+
+
+def copy_modifiers(source, targets, context=None, bulk_threshold=BULK_COPY_THRESHOLD):
+    """Append source's modifier stack to every target.
+
+    With a context and at least bulk_threshold targets that have no modifiers
+    yet, the whole stack is copied by one make_links_data call; otherwise each
+    modifier is rebuilt from its cached list of writable properties.
+    """
+    targets = [ob for ob in targets if ob != source]
+    if not source.modifiers or not targets:
+        return
+    if context is not None and len(targets) >= bulk_threshold and not any(ob.modifiers for ob in targets):
+        link_modifiers(source, targets, context)
+        return
+    for ob in targets:
+        for mod in source.modifiers:
+            copy_modifier(mod, ob)
+
+
+
+def get_grid_cells(grid_size, gap, spans, scale):
+    """Return (name suffix, location) of every grid cell, centred like the original 4 x 4 layout."""
+    count_x, count_y, count_z = grid_size
+    x_span, y_span, z_span = spans
+    width = len(str(max(grid_size) - 1))
+
+    cells = []
+    for k in range(count_z):
+        for i in range(count_y):
+            for j in range(count_x):
+                indices = (i, j, k) if count_z > 1 else (i, j)
+                suffix = "".join(str(n).zfill(width) for n in indices)
+                x_location = x_span * ( (j - count_x // 2) *(1 + gap) + 1) *scale[0]
+                y_location = y_span * ( (i - count_y // 2) *(1 + gap) + 1) *scale[1]
+                z_location = z_span * ( k *(1 + gap)) *scale[2]
+                cells.append((suffix, (x_location, y_location, z_location)))
+    return cells
+
+
+def duplicate_on_grid(ob, collection, grid_size, gap, name_prefix, spans, share_mesh=False):
+    """Lay out copies of ob on a grid_size[0] x grid_size[1] x grid_size[2] grid and return them.
+
+    Copies are named name_prefix + "_" + their zero-padded grid indices.
+    With share_mesh every copy uses one copy of ob's mesh (linked duplicates);
+    material slot 0 is then linked per object so each copy can still get its own material.
+    """
+    scale = ob.scale.copy()
+    rot = ob.rotation_euler.copy()
+
+    shared = None
+    if share_mesh:
+        shared = ob.data.copy()
+        if len(shared.materials) == 0:
+            shared.materials.append(None)
+
+    new_objects = []
+    for suffix, location in get_grid_cells(grid_size, gap, spans, scale):
+        # Use the returned object; a name lookup could return a different object on collision
+        new_ob = bpy.data.objects.new(name = name_prefix + "_" + suffix, object_data = shared if shared is not None else ob.data.copy())
+        new_ob.location = location
+        new_ob.scale = scale
+        new_ob.rotation_euler = rot
+        new_ob[GRID_TAG] = name_prefix
+        new_objects.append(new_ob)
+
+    for new_ob in new_objects:
+        collection.objects.link(new_ob)
+    return new_objects
+
+
+def new_shaded_material(name):
+    """Create a material with the Fresnel and Hue/Saturation setup; return it and its Hue/Saturation node."""
+    mat = bpy.data.materials.new(name)
+    mat.use_nodes = True
+    nodes = mat.node_tree.nodes
+    links = mat.node_tree.links
+
+    bsdf = nodes['Principled BSDF']
+    fresnel = nodes.new("ShaderNodeFresnel")
+    fresnel.location = (-200,2)
+    hsv = nodes.new("ShaderNodeHueSaturation")
+    hsv.location = (-200, 300)
+
+    links.new(bsdf.inputs[0], hsv.outputs[0])
+    links.new(bsdf.inputs[26], hsv.outputs[0])
+    links.new(bsdf.inputs[27], fresnel.outputs[0])
+    return mat, hsv
+
+
+def get_texture_material(tex, name_prefix, materials, library):
+    """Return the shared material for tex, building it on first use.
+
+    Objects only differ in their "hue" property, which the material reads
+    through an Object attribute node, so one material per texture is enough.
+    materials caches them by texture name for the current run; a material left
+    by a previous run under the same name is reused.
+    """
+    mat = materials.get(tex)
+    if mat is not None:
+        return mat
+
+    mat_name = name_prefix + "_" + tex.split('.png')[0]
+    mat = bpy.data.materials.get(mat_name)
+    if mat is None:
+        mat, hsv = new_shaded_material(mat_name)
+        nodes = mat.node_tree.nodes
+        links = mat.node_tree.links
+
+        img_tex = nodes.new("ShaderNodeTexImage")
+        img_tex.location = (-500, 250)
+        img_tex.image = library.get_image(tex)
+        hue = nodes.new("ShaderNodeAttribute")
+        hue.attribute_type = 'OBJECT'
+        hue.attribute_name = "hue"
+        hue.location = (-500, 500)
+
+        links.new(hsv.inputs[4], img_tex.outputs[0])
+        links.new(hsv.inputs[0], hue.outputs['Fac'])
+    materials[tex] = mat
+    return mat
+
+
+def create_instance_material(name, textures, library):
+    """One material for all instances; texture and hue come from the instancer's attributes."""
+    mat, hsv = new_shaded_material(name)
+    nodes = mat.node_tree.nodes
+    links = mat.node_tree.links
+
+    texture_index = nodes.new("ShaderNodeAttribute")
+    texture_index.attribute_type = 'INSTANCER'
+    texture_index.attribute_name = "texture_index"
+    texture_index.location = (-1100, 250)
+    hue = nodes.new("ShaderNodeAttribute")
+    hue.attribute_type = 'INSTANCER'
+    hue.attribute_name = "hue"
+    hue.location = (-500, 500)
+
+    # Chain the textures: each one replaces the colour where texture_index equals its index
+    color = None
+    for n, tex in enumerate(textures):
+        img_tex = nodes.new("ShaderNodeTexImage")
+        img_tex.image = library.get_image(tex)
+        img_tex.location = (-800, 250 - 300 * n)
+        if color is None:
+            color = img_tex.outputs[0]
+            continue
+        is_texture = nodes.new("ShaderNodeMath")
+        is_texture.operation = 'COMPARE'
+        is_texture.inputs[1].default_value = n
+        is_texture.inputs[2].default_value = 0.5
+        links.new(is_texture.inputs[0], texture_index.outputs['Fac'])
+        mix = nodes.new("ShaderNodeMixRGB")
+        links.new(mix.inputs[0], is_texture.outputs[0])
+        links.new(mix.inputs[1], color)
+        links.new(mix.inputs[2], img_tex.outputs[0])
+        color = mix.outputs[0]
+
+    links.new(hsv.inputs[4], color)
+    links.new(hsv.inputs[0], hue.outputs['Fac'])
+    return mat
+
+
+def instance_collection_grid(ob, collection, cells, name_prefix, mat, texture_indices, hues):
+    """One empty per cell instancing a hidden collection that holds a single copy of ob."""
+    source_collection = bpy.data.collections.get(name_prefix + "_InstanceSource")
+    if source_collection is None:
+        source_collection = bpy.data.collections.new(name_prefix + "_InstanceSource")
+    for o in list(source_collection.objects):
+        old_mesh = o.data
+        bpy.data.objects.remove(o)
+        if old_mesh.users == 0:
+            bpy.data.meshes.remove(old_mesh)
+
+    source = ob.copy()
+    source.data = ob.data.copy()
+    source.data.materials.clear()
+    source.data.materials.append(mat)
+    source.location = (0, 0, 0)
+    source_collection.objects.link(source)
+
+    new_objects = []
+    for (suffix, location), texture_index, hue in zip(cells, texture_indices, hues):
+        empty = bpy.data.objects.new(name_prefix + "_" + suffix, None)
+        empty.instance_type = 'COLLECTION'
+        empty.instance_collection = source_collection
+        empty.location = location
+        empty[GRID_TAG] = name_prefix
+        # Read by the material through 'Instancer' attribute nodes
+        empty["texture_index"] = int(texture_index)
+        empty["hue"] = float(hue)
+        new_objects.append(empty)
+
+    for empty in new_objects:
+        collection.objects.link(empty)
+    return new_objects
+
+
+def instance_points_grid(ob, collection, cells, name_prefix, mat, texture_indices, hues):
+    """A single point cloud with an Instance on Points modifier; per-instance data lives in point attributes."""
+    mesh = bpy.data.meshes.new(name_prefix + "_Points")
+    mesh.vertices.add(len(cells))
+    mesh.vertices.foreach_set("co", np.array([location for suffix, location in cells], dtype=np.float32).ravel())
+    mesh.attributes.new("texture_index", 'INT', 'POINT').data.foreach_set("value", np.asarray(texture_indices, dtype=np.int32))
+    mesh.attributes.new("hue", 'FLOAT', 'POINT').data.foreach_set("value", np.asarray(hues, dtype=np.float32))
+    points = bpy.data.objects.new(name_prefix + "_Points", mesh)
+    points[GRID_TAG] = name_prefix
+
+    group = bpy.data.node_groups.new(name_prefix + "_InstanceOnPoints", 'GeometryNodeTree')
+    if hasattr(group, "interface"):
+        group.interface.new_socket("Geometry", in_out='INPUT', socket_type='NodeSocketGeometry')
+        group.interface.new_socket("Geometry", in_out='OUTPUT', socket_type='NodeSocketGeometry')
+    else:
+        group.inputs.new('NodeSocketGeometry', "Geometry")
+        group.outputs.new('NodeSocketGeometry', "Geometry")
+    nodes = group.nodes
+    group_input = nodes.new("NodeGroupInput")
+    group_output = nodes.new("NodeGroupOutput")
+    object_info = nodes.new("GeometryNodeObjectInfo")
+    object_info.transform_space = 'ORIGINAL'
+    object_info.inputs['Object'].default_value = ob
+    set_material = nodes.new("GeometryNodeSetMaterial")
+    set_material.inputs['Material'].default_value = mat
+    instance = nodes.new("GeometryNodeInstanceOnPoints")
+    instance.inputs['Rotation'].default_value = ob.rotation_euler
+    instance.inputs['Scale'].default_value = ob.scale
+    group.links.new(instance.inputs['Points'], group_input.outputs[0])
+    group.links.new(set_material.inputs['Geometry'], object_info.outputs['Geometry'])
+    group.links.new(instance.inputs['Instance'], set_material.outputs['Geometry'])
+    group.links.new(group_output.inputs[0], instance.outputs['Instances'])
+
+    modifier = points.modifiers.new("InstanceOnPoints", 'NODES')
+    modifier.node_group = group
+    collection.objects.link(points)
+    return points
+
 
 #Get Object, Mesh data 
 ob = bpy.context.object
@@ -14,136 +437,98 @@ mesh = ob.data
 if collection_override == "":
     collection = bpy.context.collection #or bpy.data.collections['Collection_name']
 else:
-    if collection_override not in [c.name for c in bpy.data.collections]:
-        bpy.data.collections.new(collection_override)
-        collection = bpy.data.collections[collection_override]
+    collection = bpy.data.collections.get(collection_override)
+    if collection is None:
+        collection = bpy.data.collections.new(collection_override)
         bpy.context.scene.collection.children.link(collection)
-    else:
-        collection = bpy.data.collections[collection_override]    
-#get object bounding values in X and Y
-mesh_x_vals = []
-mesh_y_vals = []
-for v in mesh.vertices:
-    x_val = v.co[0]
-    y_val = v.co[1]
-    mesh_x_vals.append(x_val)    
-    mesh_y_vals.append(y_val)
-    
-min_x = min(mesh_x_vals)
-max_x = max(mesh_x_vals)   
-min_y = min(mesh_y_vals)
-max_y = max(mesh_y_vals)  
-
-x_span = max_x - min_x
-y_span = max_y - min_y
+#get object bounding values in X, Y and Z, cached until the mesh is edited
+set_handler(bpy.app.handlers.depsgraph_update_post, q1_on_depsgraph_update)
+set_handler(bpy.app.handlers.load_post, q1_on_load_post)
+bounds_min, bounds_max = get_mesh_bounds(mesh)
+x_span, y_span, z_span = (float(span) for span in bounds_max - bounds_min)
 #print(x_span, y_span)
 
-#get object scale, rotation
-scale = ob.scale
-rot = ob.rotation_euler
+name_prefix = ob.name if object_name_override == "" else object_name_override
 
-#Delete objects and material from collection
+#Delete objects, meshes and materials a previous run generated in collection; everything else stays
 if collection is not None:
-    for o in collection.objects:
-        if len(o.material_slots) > 0:
-            m = o.material_slots[0].material
+    old_objects = [o for o in collection.objects if GRID_TAG in o and o != ob]
+    old_meshes = {o.data for o in old_objects if o.type == 'MESH'}
+    old_materials = {o.material_slots[0].material for o in old_objects
+                     if len(o.material_slots) > 0 and o.material_slots[0].material is not None}
+    for o in old_objects:
+        bpy.data.objects.remove(o)
+    for m in old_meshes:
+        if m.users == 0:
+            bpy.data.meshes.remove(m)
+    for m in old_materials:
+        if m.users == 0:
             bpy.data.materials.remove(m)
-        if o.type == 'MESH':
-            bpy.data.meshes.remove(o.data)
-        #bpy.data.objects.remove(o)
-
-#Create Objects and link it into the Scene
-for i in range(-2,2):
-    for j in range(-2,2):
-        if object_name_override == "":
-            new_ob_name = ob.name + "_" +str(i+2)+str(j+2)
-        else:
-            new_ob_name = object_name_override + "_" +str(i+2)+str(j+2)
-        bpy.data.objects.new(name = new_ob_name, object_data = mesh.copy())
-        new_ob = bpy.data.objects[new_ob_name]
-        collection.objects.link(new_ob)
-        
-        x_location = x_span * ( j *(1 + gap_between_objects) + 1) *scale[0]
-        y_location = y_span * ( i *(1 + gap_between_objects) + 1) *scale[1]
-        new_ob.location = (x_location,y_location,0) 
-        new_ob.scale = scale
-        new_ob.rotation_euler = rot
-        
+    #Leftovers of a previous instancing run
+    old_group = bpy.data.node_groups.get(name_prefix + "_InstanceOnPoints")
+    if old_group is not None:
+        bpy.data.node_groups.remove(old_group)
+    old_material = bpy.data.materials.get(name_prefix + "_Instances")
+    if old_material is not None:
+        bpy.data.materials.remove(old_material)
 
 """Get Textures from Path"""
 rel_texture_path = 'SuzaneTextures//'
 file_path = bpy.data.filepath
 dirname = os.path.dirname(file_path)
 tex_dir = os.path.join(dirname, rel_texture_path)
-textures = [f for f in os.listdir(tex_dir) if f.endswith('.png')]
-
-"""Load textures"""
-for tex in textures:
-    tex_path = os.path.join(tex_dir, tex)
-    bpy.data.images.load(tex_path, check_existing=True)
-
-"""For each object in collection"""    
-for ob in collection.objects:
-    """Choose mat"""
-    tex_choice = np.random.choice(textures)
-    mat_name = tex_choice.split('.png')[0]
-    
-    """Create mat"""
-    mat = bpy.data.materials.new(mat_name)
-    mat.use_nodes = True
+# Images are loaded when a material first uses them; the directory listing is cached
+texture_library = TextureLibrary(tex_dir)
+textures = texture_library.names
+if prefetch_textures:
+    texture_library.prefetch()
 
-    """NODE CREATION"""
-    bsdf = mat.node_tree.nodes['Principled BSDF']
+#Create Objects and link it into the Scene
+if output_mode == "OBJECTS":
+    new_objects = duplicate_on_grid(ob, collection, grid_size, gap_between_objects, name_prefix,
+                      (x_span, y_span, z_span), share_mesh)
+        
 
-    fresnel = mat.node_tree.nodes.new("ShaderNodeFresnel")
-    fresnel.location = (-200,2)
+if output_mode == "OBJECTS":
+    """For each generated object"""
+    materials = {}
+    for ob in new_objects:
+        """Choose mat"""
+        tex_choice = np.random.choice(textures)
+        mat = get_texture_material(tex_choice, name_prefix, materials, texture_library)
 
-    hsv = mat.node_tree.nodes.new("ShaderNodeHueSaturation")
-    hsv.location = (-200, 300)
+        """SET VALUES"""
+        # Read by the material's Object attribute node
+        ob["hue"] = np.random.random()
 
-    img_tex = mat.node_tree.nodes.new("ShaderNodeTexImage")
-    img_tex.location = (-500, 250)
-
-    """NODE LINKS"""
-    mat.node_tree.links.new(bsdf.inputs[0], hsv.outputs[0])
-    mat.node_tree.links.new(bsdf.inputs[26], hsv.outputs[0])
-    mat.node_tree.links.new(bsdf.inputs[27], fresnel.outputs[0])
-    mat.node_tree.links.new(hsv.inputs[4], img_tex.outputs[0])
-
-    """SET VALUES"""
-    img_tex.image = bpy.data.images[tex_choice]
-    hsv.inputs[0].default_value = np.random.random()
-    
-    """APPLY MATERIAL"""
-    if len(ob.material_slots)==0:
-        ob.data.materials.append(mat)
+        """APPLY MATERIAL"""
+        if len(ob.material_slots)==0:
+            ob.data.materials.append(mat)
+        else:
+            if ob.data.users > 1:
+                # Linked duplicates share the mesh, so the material goes on the object
+                ob.material_slots[0].link = 'OBJECT'
+            ob.material_slots[0].material = mat
+else:
+    """Instances share one material; texture and hue are per-instance attributes"""
+    cells = get_grid_cells(grid_size, gap_between_objects, (x_span, y_span, z_span), ob.scale)
+    texture_indices = np.random.randint(len(textures), size=len(cells))
+    hues = np.random.random(len(cells))
+    mat = create_instance_material(name_prefix + "_Instances", textures, texture_library)
+    if output_mode == "COLLECTION_INSTANCES":
+        instance_collection_grid(ob, collection, cells, name_prefix, mat, texture_indices, hues)
     else:
-        ob.material_slots[0].material = mat
-        
-    """rename Mat"""
-    mat.name = mat.name.split('.')[0] + "_" +ob.name.split('_')[1]
-    
-    
-    
-
-"""COPY MODIFIERS FROM ACTIVE TO DUPLICATES"""
-active_obj = bpy.context.view_layer.objects.active
-
-# Get duplicvate objects except the active object
-duplicate_objects = [o for o in collection.objects if o != active_obj]
-
-# Loop through all modifiers of the active object
-for mod in active_obj.modifiers:
-    for obj in duplicate_objects:
-        new_mod = obj.modifiers.new(name=mod.name, type=mod.type)
-        # Copy properties from the source modifier to the new modifier
-        for attr in dir(mod):
-            if not attr.startswith("_") and hasattr(new_mod, attr):
-                try:
-                    setattr(new_mod, attr, getattr(mod, attr))
-                except AttributeError:
-                    pass
-        
-        print(f"Copied modifier '{mod.name}' of type '{mod.type}' from {active_obj.name} to {obj.name}")
+        instance_points_grid(ob, collection, cells, name_prefix, mat, texture_indices, hues)
+texture_library.close()
+
+
+if output_mode == "OBJECTS":
+    """COPY MODIFIERS FROM ACTIVE TO DUPLICATES"""
+    active_obj = bpy.context.view_layer.objects.active
 
+    # Get duplicate objects except the active object
+    duplicate_objects = [o for o in new_objects if o != active_obj]
 
+    # Large grids get the whole stack in one make_links_data call
+    copy_modifiers(active_obj, duplicate_objects, bpy.context)
+    print(f"Copied {len(active_obj.modifiers)} modifier(s) from {active_obj.name} to {len(duplicate_objects)} object(s)")
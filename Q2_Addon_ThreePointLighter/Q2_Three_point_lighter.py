@@ -8,9 +8,544 @@ bl_info = {
     "category": "Lighting",
 }
 
+import os
 import bpy
+import json
+import time
 import random
+import functools
 import mathutils
+import tracemalloc
+import numpy as np
+from collections import OrderedDict
+from contextlib import contextmanager
+from bpy.app.handlers import persistent
+
+# Light domain size relative to the object bounds, scaled around the base
+LIGHT_DOMAIN_SCALE = (3, 3, 1.2)
+# Every object the addon creates is linked into this collection and tagged with its rig and role
+RIG_COLLECTION_NAME = "3_Point_Lighter"
+# Cached world bounds of rotated instances across all meshes
+MAX_WORLD_BOUNDS = 50000
+
+# Switch and log name of the shared profiling block below
+PROFILING_PROPERTY = "three_point_lighter_profiling"
+PROFILE_LOG_NAME = "three_point_lighter_profile.json"
+
+# --- shared block "profiling": generated from shared/profiling.py by shared/sync.py, edit it there ---
+# Opt-in operator profiling, switched on by the WindowManager property named PROFILING_PROPERTY.
+# Runs are appended to the rolling log PROFILE_LOG_NAME in Blender's user config directory.
+MAX_PROFILE_ENTRIES = 500
+# Profile of the operator currently running; nested operators are folded into it
+_active_profile = None
+# Last profile per operator, shown in the Profiling subpanel
+_last_profiles = {}
+
+class OperatorProfile:
+    """Wall time per stage, bpy.ops calls and tracemalloc peak of one operator run."""
+
+    def __init__(self, operator):
+        self.operator = operator
+        self.started = time.time()
+        self.seconds = 0.0
+        self.stages = {}
+        self.ops_calls = None
+        self.peak_bytes = 0
+        self.result = None
+
+def get_profile_log_path():
+    return os.path.join(bpy.utils.user_resource('CONFIG'), PROFILE_LOG_NAME)
+
+@contextmanager
+def profile_stage(name):
+    # Stages with the same name add up, so a stage can be entered once per file or per rig
+    profile = _active_profile
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        if profile is not None:
+            profile.stages[name] = profile.stages.get(name, 0.0) + time.perf_counter() - start
+
+def count_ops_calls(profile):
+    # bpy.ops operators are called through this class; returns a function that undoes the patch
+    op_class = getattr(bpy.ops, "_BPyOpsSubModOp", None)
+    if op_class is None:
+        return lambda: None
+    original = op_class.__call__
+
+    def counted_call(self, *args, **kwargs):
+        profile.ops_calls += 1
+        return original(self, *args, **kwargs)
+
+    profile.ops_calls = 0
+    op_class.__call__ = counted_call
+
+    def restore():
+        op_class.__call__ = original
+    return restore
+
+def finish_profile(profile, result):
+    # Shows the profile in the subpanel and appends it to the log
+    profile.result = None if result is None else sorted(result)
+    _last_profiles[profile.operator] = profile
+    path = get_profile_log_path()
+    try:
+        with open(path) as f:
+            entries = json.load(f)
+    except (OSError, ValueError):
+        entries = []
+    entries.append(vars(profile))
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(entries[-MAX_PROFILE_ENTRIES:], f, indent=1)
+    except OSError as e:
+        print(f"Could not write operator profile log {path}: {e}")
+
+def profiled(execute):
+    """Decorator for Operator.execute; records a profile when profiling is switched on.
+
+    If execute returns RUNNING_MODAL the profile is left open as self._profile;
+    the modal part adds to it and hands it to finish_profile when it is done.
+    """
+    @functools.wraps(execute)
+    def wrapper(self, context):
+        global _active_profile
+        if _active_profile is not None or not getattr(context.window_manager, PROFILING_PROPERTY, False):
+            return execute(self, context)
+
+        profile = OperatorProfile(self.bl_idname)
+        _active_profile = profile
+        restore_ops = count_ops_calls(profile)
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        else:
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+        result = None
+        try:
+            result = execute(self, context)
+            return result
+        finally:
+            profile.seconds = time.perf_counter() - start
+            profile.peak_bytes = tracemalloc.get_traced_memory()[1]
+            if started_tracing:
+                tracemalloc.stop()
+            restore_ops()
+            _active_profile = None
+            if result is not None and 'RUNNING_MODAL' in result:
+                self._profile = profile
+            else:
+                finish_profile(profile, result)
+    return wrapper
+
+def draw_profiles(layout, context):
+    layout.prop(context.window_manager, PROFILING_PROPERTY)
+    for profile in _last_profiles.values():
+        box = layout.box()
+        ops_calls = "n/a" if profile.ops_calls is None else profile.ops_calls
+        box.label(text=f"{profile.operator}: {profile.seconds:.3f}s")
+        box.label(text=f"bpy.ops calls: {ops_calls}, peak: {profile.peak_bytes / 2**20:.1f} MiB")
+        col = box.column(align=True)
+        for name, seconds in profile.stages.items():
+            col.label(text=f"{name}: {seconds:.3f}s")
+    if _last_profiles:
+        layout.label(text=f"Log: {get_profile_log_path()}")
+
+def register_profiling():
+    setattr(bpy.types.WindowManager, PROFILING_PROPERTY, bpy.props.BoolProperty(
+        name="Profile Operators",
+        description="Record stage timings, bpy.ops calls and peak memory of this addon's operators",
+        default=False,
+    ))
+
+def unregister_profiling():
+    delattr(bpy.types.WindowManager, PROFILING_PROPERTY)
+# --- end of shared block "profiling" ---
+
+# --- shared block "hierarchy_index": generated from shared/hierarchy_index.py by shared/sync.py, edit it there ---
+class HierarchyIndex:
+    """Parent and children of every object in bpy.data, kept current from depsgraph updates.
+
+    The attributes are stored in state, so a text block can pass a dict kept
+    in bpy.app.driver_namespace and keep the index across runs.
+    """
+
+    def __init__(self, state=None):
+        self.__dict__ = {} if state is None else state
+        if "parent" not in self.__dict__:
+            self.parent = {}
+            self.children = {}
+            self.dirty = True
+
+    def rebuild(self):
+        self.parent = {}
+        self.children = {}
+        for ob in bpy.data.objects:
+            self._add(ob)
+        self.dirty = False
+
+    def _add(self, ob):
+        self.parent[ob] = ob.parent
+        if ob.parent is not None:
+            self.children.setdefault(ob.parent, []).append(ob)
+
+    def _remove(self, ob):
+        parent = self.parent.pop(ob)
+        if parent is not None:
+            siblings = self.children[parent]
+            siblings.remove(ob)
+            if not siblings:
+                del self.children[parent]
+
+    def update_object(self, ob):
+        if ob in self.parent:
+            if self.parent[ob] == ob.parent:
+                return
+            self._remove(ob)
+        self._add(ob)
+
+    def update(self, depsgraph):
+        # Added and re-parented objects are reported; removed ones are not
+        if self.dirty:
+            return
+        for update in depsgraph.updates:
+            if isinstance(update.id, bpy.types.Object):
+                self.update_object(update.id.original)
+
+    def ensure(self, tracked=True):
+        # Untracked means no handler keeps the index current, so it is rebuilt for every query.
+        # A changed object count catches removals; _get_valid_children catches those the count hides.
+        if self.dirty or not tracked or len(self.parent) != len(bpy.data.objects):
+            self.rebuild()
+        return self
+
+    def _get_valid_children(self, ob):
+        # A removal paired with an unseen addition keeps the count; the removed child then raises
+        # ReferenceError, or its reused pointer reports another parent
+        children = self.children.get(ob, ())
+        try:
+            valid = all(child.parent == ob for child in children)
+        except ReferenceError:
+            valid = False
+        if not valid:
+            self.rebuild()
+            children = self.children.get(ob, ())
+        return children
+
+    def get_children(self, ob):
+        # Name order, the same after any edit history; the lists themselves follow update order
+        return sorted(self._get_valid_children(ob), key=lambda child: child.name)
+
+    def descendants(self, ob):
+        # Depth-first, same set of objects as ob.children_recursive
+        result = []
+        stack = list(reversed(self._get_valid_children(ob)))
+        while stack:
+            child = stack.pop()
+            result.append(child)
+            stack.extend(reversed(self._get_valid_children(child)))
+        return result
+# --- end of shared block "hierarchy_index" ---
+
+_hierarchy_index = HierarchyIndex()
+# Per-mesh local stats, keyed by mesh datablock identity and checked against its geometry version
+_local_stats = {}
+_geometry_versions = {}
+# World bounds of rotated instances, least recently used first, keyed by
+# (mesh pointer, geometry version, matrix bytes); entries of edited meshes age out
+_world_bounds = OrderedDict()
+
+def get_hierarchy_index():
+    # Without the handler nothing keeps the index current
+    return _hierarchy_index.ensure(three_point_lighter_on_depsgraph_update in bpy.app.handlers.depsgraph_update_post)
+
+# --- shared block "root_objects": generated from shared/root_objects.py by shared/sync.py, edit it there ---
+def get_root_objects(objects):
+    # Objects that have no ancestor in the given set
+    selected = set(objects)
+    roots = []
+    for ob in objects:
+        parent = ob.parent
+        while parent is not None and parent not in selected:
+            parent = parent.parent
+        if parent is None:
+            roots.append(ob)
+    return roots
+# --- end of shared block "root_objects" ---
+
+# --- shared block "mesh_objects": generated from shared/mesh_objects.py by shared/sync.py, edit it there ---
+def get_mesh_objects(parent_ob, descendants):
+    # parent_ob and its descendants that are meshes
+    if parent_ob.type == 'MESH':
+        yield parent_ob
+    for child in descendants:
+        if child.type == 'MESH':
+            yield child
+# --- end of shared block "mesh_objects" ---
+
+# --- shared block "transforms": generated from shared/transforms.py by shared/sync.py, edit it there ---
+# Floats per object of every transform attribute read_transforms can bulk-read
+TRANSFORM_SIZES = {"matrix_world": 16, "location": 3, "rotation_euler": 3, "scale": 3}
+# Up to this many objects, reading them one by one is cheaper than a pass over bpy.data.objects
+PER_OBJECT_LIMIT = 256
+
+class TransformSnapshot:
+    """Transforms of every object in bpy.data, read with one foreach_get per attribute on first use."""
+
+    def __init__(self):
+        self.objects = bpy.data.objects
+        self.rows = {ob: i for i, ob in enumerate(self.objects)}
+        self.arrays = {}
+
+    def read(self, attr):
+        array = self.arrays.get(attr)
+        if array is None:
+            flat = np.empty(len(self.objects) * TRANSFORM_SIZES[attr], dtype=np.float32)
+            self.objects.foreach_get(attr, flat)
+            if attr == "matrix_world":
+                # RNA stores matrices column by column
+                array = flat.reshape(-1, 4, 4).transpose(0, 2, 1)
+            else:
+                array = flat.reshape(-1, 3)
+            self.arrays[attr] = array
+        return array
+
+def read_transforms(objects, attributes, snapshot=None):
+    """Transforms of objects as float32 arrays keyed by attribute; row i belongs to objects[i].
+
+    matrix_world is (n, 4, 4) in row-major (mathutils) order, the others are
+    (n, 3). Pass a TransformSnapshot to share one read of the file between calls.
+    """
+    objects = list(objects)
+    if snapshot is None and len(objects) <= PER_OBJECT_LIMIT:
+        arrays = {}
+        for attr in attributes:
+            shape = (len(objects), 4, 4) if attr == "matrix_world" else (len(objects), 3)
+            array = np.empty(shape, dtype=np.float32)
+            for i, ob in enumerate(objects):
+                array[i] = getattr(ob, attr)
+            arrays[attr] = array
+        return arrays
+
+    if snapshot is None:
+        snapshot = TransformSnapshot()
+    rows = np.fromiter((snapshot.rows[ob] for ob in objects), dtype=np.intp, count=len(objects))
+    return {attr: snapshot.read(attr)[rows] for attr in attributes}
+# --- end of shared block "transforms" ---
+
+class VertexStats:
+    """Running vertex count, sum and bounds, fed one mesh at a time."""
+
+    def __init__(self):
+        self.count = 0
+        self.sum = np.zeros(3, dtype=np.float64)
+        self._compensation = np.zeros(3, dtype=np.float64)
+        self.min = np.full(3, np.inf)
+        self.max = np.full(3, -np.inf)
+
+    def add_sum(self, vertex_sum, count, bounds_min, bounds_max):
+        # Kahan summation across meshes keeps the centroid stable for large scenes
+        y = np.asarray(vertex_sum, dtype=np.float64) - self._compensation
+        t = self.sum + y
+        self._compensation = (t - self.sum) - y
+        self.sum = t
+        self.count += count
+        self.min = np.minimum(self.min, bounds_min)
+        self.max = np.maximum(self.max, bounds_max)
+
+    @property
+    def bounds(self):
+        if self.count == 0:
+            return None
+        return self.min, self.max
+
+class LocalMeshStats:
+    """Local-space vertex count, sum and bounds of one mesh datablock."""
+
+    def __init__(self, count, vertex_sum, bounds_min, bounds_max):
+        self.count = count
+        self.sum = vertex_sum
+        self.min = bounds_min
+        self.max = bounds_max
+        self.version = None
+
+# --- shared block "mesh_verts": generated from shared/mesh_verts.py by shared/sync.py, edit it there ---
+def get_local_mesh_verts(mesh):
+    # Read all vertex coordinates in one call
+    vertices = mesh.vertices
+    co = np.empty(len(vertices) * 3, dtype=np.float32)
+    vertices.foreach_get("co", co)
+    return co.reshape(-1, 3)
+# --- end of shared block "mesh_verts" ---
+
+def get_local_mesh_stats(mesh):
+    pointer = mesh.as_pointer()
+    # The vertex count guards against edits made while the handlers are not registered
+    version = (_geometry_versions.get(pointer, 0), len(mesh.vertices))
+    stats = _local_stats.get(pointer)
+    if stats is None or stats.version != version:
+        co = get_local_mesh_verts(mesh)
+        if len(co):
+            stats = LocalMeshStats(len(co), co.sum(axis=0, dtype=np.float64), co.min(axis=0), co.max(axis=0))
+        else:
+            stats = LocalMeshStats(0, np.zeros(3), np.zeros(3), np.zeros(3))
+        stats.version = version
+        _local_stats[pointer] = stats
+    return stats
+
+def get_world_mesh_stats(ob, matrix_world):
+    # Returns (count, world-space sum, world min, world max) of a mesh object
+    local = get_local_mesh_stats(ob.data)
+    matrix = np.array(matrix_world, dtype=np.float64)
+    linear = matrix[:3, :3]
+    translation = matrix[:3, 3]
+
+    # The sum is affine, so the world sum follows directly from the local one
+    world_sum = linear @ local.sum + local.count * translation
+
+    if np.count_nonzero(linear, axis=1).max() <= 1:
+        # Scale and axis flips keep the box axis-aligned; transform its corners
+        corners = np.stack([local.min, local.max]) @ linear.T + translation
+        return local.count, world_sum, corners.min(axis=0), corners.max(axis=0)
+
+    # Rotated instances need the vertices once per distinct transform
+    key = (ob.data.as_pointer(), local.version, matrix.tobytes())
+    bounds = _world_bounds.get(key)
+    if bounds is None:
+        co = get_local_mesh_verts(ob.data).astype(np.float64) @ linear.T + translation
+        bounds = (co.min(axis=0), co.max(axis=0))
+        _world_bounds[key] = bounds
+        if len(_world_bounds) > MAX_WORLD_BOUNDS:
+            _world_bounds.popitem(last=False)
+    else:
+        _world_bounds.move_to_end(key)
+    return local.count, world_sum, bounds[0], bounds[1]
+
+def clear_mesh_cache():
+    _local_stats.clear()
+    _geometry_versions.clear()
+    _world_bounds.clear()
+
+def accumulate_cached_mesh_stats(parent_ob, snapshot=None):
+    """World-space vertex stats of a hierarchy without re-reading unchanged meshes.
+
+    snapshot is an optional TransformSnapshot; pass one when summing many hierarchies.
+    """
+    if three_point_lighter_on_depsgraph_update not in bpy.app.handlers.depsgraph_update_post:
+        # Without the handler mesh edits go unnoticed, so nothing cached can be trusted
+        clear_mesh_cache()
+    stats = VertexStats()
+    descendants = get_hierarchy_index().descendants(parent_ob)
+    mesh_objects = list(get_mesh_objects(parent_ob, descendants))
+    matrices = read_transforms(mesh_objects, ("matrix_world",), snapshot)["matrix_world"]
+    for ob, matrix_world in zip(mesh_objects, matrices):
+        count, world_sum, bounds_min, bounds_max = get_world_mesh_stats(ob, matrix_world)
+        if count:
+            stats.add_sum(world_sum, count, bounds_min, bounds_max)
+    return stats
+
+@persistent
+def three_point_lighter_on_depsgraph_update(scene, depsgraph):
+    _hierarchy_index.update(depsgraph)
+    for update in depsgraph.updates:
+        if not update.is_updated_geometry:
+            continue
+        data = update.id.original
+        if isinstance(data, bpy.types.Object):
+            data = data.data
+        if isinstance(data, bpy.types.Mesh):
+            pointer = data.as_pointer()
+            _geometry_versions[pointer] = _geometry_versions.get(pointer, 0) + 1
+            _local_stats.pop(pointer, None)
+
+@persistent
+def three_point_lighter_on_data_reloaded(*args):
+    # Undo, redo and file loads replace every object, so the stored references are stale
+    _hierarchy_index.dirty = True
+
+@persistent
+def three_point_lighter_on_load_post(*args):
+    # Datablock pointers are not valid across files
+    clear_mesh_cache()
+
+class Bounds:
+    """World-space axis-aligned box that the light placement works from."""
+
+    def __init__(self, min_co, max_co):
+        self.min_x, self.min_y, self.min_z = (float(v) for v in min_co)
+        self.max_x, self.max_y, self.max_z = (float(v) for v in max_co)
+
+    def dimensions(self):
+        return self.min_x, self.max_x, self.min_y, self.max_y, self.min_z, self.max_z
+
+    def scaled_from_base(self, x, y, z):
+        # Scale around the centre of the bottom face
+        center_x = (self.min_x + self.max_x) / 2
+        center_y = (self.min_y + self.max_y) / 2
+        half_x = (self.max_x - self.min_x) * x / 2
+        half_y = (self.max_y - self.min_y) * y / 2
+        height = (self.max_z - self.min_z) * z
+        return Bounds((center_x - half_x, center_y - half_y, self.min_z),
+                      (center_x + half_x, center_y + half_y, self.min_z + height))
+
+def get_hierarchy_bounds(parent_ob, snapshot=None):
+    stats = accumulate_cached_mesh_stats(parent_ob, snapshot)
+    if stats.count == 0:
+        return None
+    return Bounds(*stats.bounds)
+
+def create_box_object(name, bounds):
+    # Build the wire box directly from data, with its origin at the centre of the base
+    min_x, max_x, min_y, max_y, min_z, max_z = bounds.dimensions()
+    half_x = (max_x - min_x) / 2
+    half_y = (max_y - min_y) / 2
+    height = max_z - min_z
+    verts = [(x, y, z) for x in (-half_x, half_x) for y in (-half_y, half_y) for z in (0, height)]
+    faces = [(0, 1, 3, 2), (4, 6, 7, 5), (0, 4, 5, 1), (2, 3, 7, 6), (0, 2, 6, 4), (1, 5, 7, 3)]
+
+    mesh = bpy.data.meshes.new(name)
+    mesh.from_pydata(verts, [], faces)
+    mesh.update()
+    box = bpy.data.objects.new(name, mesh)
+    box.location = (min_x + half_x, min_y + half_y, min_z)
+    box.hide_render = True
+    box.display_type = 'WIRE'
+    return box
+
+def get_rig_collection(scene, create=False):
+    props = scene.three_point_lighter
+    collection = props.rig_collection
+    if collection is None and create:
+        collection = bpy.data.collections.new(RIG_COLLECTION_NAME)
+        scene.collection.children.link(collection)
+        props.rig_collection = collection
+    return collection
+
+def get_rig_objects(scene, rig=None, roles=None):
+    # Only walks the addon's own collection, never the whole scene
+    collection = get_rig_collection(scene)
+    if collection is None:
+        return []
+    return [ob for ob in collection.objects
+            if (rig is None or ob.get("three_point_rig") == rig)
+            and (roles is None or ob.get("three_point_role") in roles)]
+
+def add_rig_object(ob, scene, rig, role):
+    get_rig_collection(scene, create=True).objects.link(ob)
+    ob["three_point_rig"] = rig
+    ob["three_point_role"] = role
+
+def remove_rig_objects(objects):
+    for ob in objects:
+        if ob.type == 'MESH':
+            bpy.data.meshes.remove(ob.data)
+        elif ob.type == 'LIGHT':
+            bpy.data.lights.remove(ob.data)
+        else:
+            bpy.data.objects.remove(ob)
 
 class ThreePointLighterProperties(bpy.types.PropertyGroup):
     light1_type: bpy.props.EnumProperty(
@@ -67,6 +602,21 @@ class ThreePointLighterProperties(bpy.types.PropertyGroup):
         min=0.0, max=1.0,
         default=(1.0, 1.0, 1.0),
     )
+    show_points: bpy.props.BoolProperty(
+        name="Show Placement Points",
+        description="Keep markers at the light positions and targets for debugging",
+        default=False,
+    )
+    batch_mode: bpy.props.BoolProperty(
+        name="All Selected Roots",
+        description="Generate an independent rig for every selected root object",
+        default=False,
+    )
+    rig_collection: bpy.props.PointerProperty(
+        name="Rig Collection",
+        description="Collection holding the generated lights, bounds and markers",
+        type=bpy.types.Collection,
+    )
 
 class OBJECT_PT_ThreePointLighterPanel(bpy.types.Panel):
     bl_label = "3 Point Lighter"
@@ -85,13 +635,15 @@ class OBJECT_PT_ThreePointLighterPanel(bpy.types.Panel):
         box.label(text="Instruction")
         col = box.column(align=True)
         col.label(text="Step1: Select any parent object(mesh or empty) or individual mesh.")
-        col.label(text="Step2: 'Visualize Bounds' > 'Generate Lights'.")
+        col.label(text="Step2: 'Generate Lights' ('Visualize Bounds' is optional).")
 
         # Generate 3 point lights Panel
         box = layout.box()
         box.label(text="Generate 3 point lights")
         col = box.column(align=True)
         col.operator("lighting.visualize_bounds", text="Visualize Bounds")
+        col.prop(three_point_lighter, "batch_mode")
+        col.prop(three_point_lighter, "show_points")
         col.operator("lighting.generate_lights", text="Generate Lights")
 
         # Update Lights Panel
@@ -123,88 +675,25 @@ class LIGHTING_OT_VisualizeBounds(bpy.types.Operator):
     bl_label = "Visualize Bounds"
     bl_description = "Visualize the bounds of the selected object"
 
+    @profiled
     def execute(self, context):
-        def get_world_mesh_verts(ob):         
-            if ob.type == 'MESH':
-                world_matrix = ob.matrix_world
-                return [world_matrix @ vertex.co for vertex in ob.data.vertices]
-            else:
-                return []
-            
+        if context.object is None:
+            self.report({'WARNING'}, "No active object found")
+            return {'CANCELLED'}
 
-        def get_all_world_mesh_verts(parent_ob):
-            verts = []
-            if parent_ob.type == 'MESH':
-                verts.extend(get_world_mesh_verts(parent_ob))
-            for child in parent_ob.children_recursive:
-                if child.type == 'MESH':
-                    verts.extend(get_world_mesh_verts(child))                            
-            return verts
-
-        def create_bounding_box(vertices):
-            if not vertices:
-                print("No vertices provided.")
-                return None
-
-            # Calculate the min and max coordinates
-            min_x = min(v[0] for v in vertices)
-            max_x = max(v[0] for v in vertices)
-            min_y = min(v[1] for v in vertices)
-            max_y = max(v[1] for v in vertices)
-            min_z = min(v[2] for v in vertices)
-            max_z = max(v[2] for v in vertices)
-
-            # Calculate the spans
-            x_span = max_x - min_x
-            y_span = max_y - min_y
-            z_span = max_z - min_z
-
-            # Create a cube
-            bpy.ops.mesh.primitive_cube_add(size=2, enter_editmode=False, align='WORLD', location=(0, 0, 0))
-            cube = bpy.context.object
-            
-            # Scale the cube
-            cube.scale = (x_span / 2, y_span / 2, z_span / 2)
-            
-            # Apply the scale to the cube
-            bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-            
-            # Move the origin to the base of the cube
-            bpy.ops.object.origin_set(type='ORIGIN_CENTER_OF_VOLUME', center='BOUNDS')
-            bpy.ops.object.editmode_toggle()
-            bpy.ops.mesh.select_all(action='SELECT')
-            bpy.ops.transform.translate(value=(0, 0, z_span / 2))
-            bpy.ops.object.editmode_toggle()
-            
-            # Move the cube to the specified min bounds
-            cube.location = (min_x + x_span / 2, min_y + y_span / 2, min_z)
-            cube.hide_render = True
-            cube.display_type = 'WIRE'
-            # Return the cube object
-            return cube
-
-        def create_bounding_boxes():
-            parent_ob = bpy.context.object
-            vertices = get_all_world_mesh_verts(parent_ob)
-            cube = create_bounding_box(vertices)
-            cube2 = create_bounding_box(vertices)
-            cube2.scale[0]*=3
-            cube2.scale[1]*=3
-            cube2.scale[2]*=1.2 
-            cube.name = "BoundingBoxCube"
-            cube2.name = "LightDomain"
-
-        def delete_boxes():
-            boxes = ["BoundingBoxCube", "LightDomain"]
-            all_object_names = [o.name for o in bpy.data.objects]
-
-            for ob_name in boxes:
-                if ob_name in all_object_names:
-                    ob = bpy.data.objects[ob_name]
-                    if ob.type == 'MESH':
-                        bpy.data.meshes.remove(ob.data)
-        delete_boxes()
-        create_bounding_boxes()
+        boxes = ["BoundingBoxCube", "LightDomain"]
+        with profile_stage("cleanup"):
+            remove_rig_objects(get_rig_objects(context.scene, rig="", roles=boxes))
+        with profile_stage("bounds"):
+            bounds = get_hierarchy_bounds(context.object)
+        if bounds is None:
+            self.report({'WARNING'}, "No mesh found in the selected hierarchy")
+            return {'CANCELLED'}
+        with profile_stage("box creation"):
+            box = create_box_object("BoundingBoxCube", bounds)
+            add_rig_object(box, context.scene, "", "BoundingBoxCube")
+            box = create_box_object("LightDomain", bounds.scaled_from_base(*LIGHT_DOMAIN_SCALE))
+            add_rig_object(box, context.scene, "", "LightDomain")
         self.report({'INFO'}, "Visualize Bounds executed")
         return {'FINISHED'}
 
@@ -213,18 +702,8 @@ class LIGHTING_OT_GenerateLights(bpy.types.Operator):
     bl_label = "Generate Lights"
     bl_description = "Generate 3 point lights"
 
+    @profiled
     def execute(self, context):
-        def get_bounding_box_dimensions(obj):
-            local_coords = [obj.matrix_world @ v.co for v in obj.data.vertices]
-            min_x = min(v.x for v in local_coords)
-            max_x = max(v.x for v in local_coords)
-            min_y = min(v.y for v in local_coords)
-            max_y = max(v.y for v in local_coords)
-            min_z = min(v.z for v in local_coords)
-            max_z = max(v.z for v in local_coords)
-            
-            return min_x, max_x, min_y, max_y, min_z, max_z
-
         def generate_random_point_within_bounds(min_x, max_x, min_y, max_y, z_range, error=0.1):
             x = random.uniform(min_x, max_x)
             y = random.uniform(min_y, max_y)
@@ -232,12 +711,14 @@ class LIGHTING_OT_GenerateLights(bpy.types.Operator):
             return (x, y, z)
 
         def spawn_point(location, name):
-            bpy.ops.mesh.primitive_uv_sphere_add(radius=0.1, location=location)
-            sphere = bpy.context.object
-            sphere.name = name
-            sphere.hide_render = True
-            sphere.display_type = 'WIRE'
-            
+            # Debug marker only; placement itself never needs scene objects
+            marker = bpy.data.objects.new(name, None)
+            marker.empty_display_type = 'SPHERE'
+            marker.empty_display_size = 0.1
+            marker.location = location
+            marker.hide_render = True
+            return marker
+
         def generate_random_surface_point(min_x, max_x, min_y, max_y, z_range, surface='z'):
             if surface == 'z':
                 x = random.uniform(min_x, max_x)
@@ -253,32 +734,18 @@ class LIGHTING_OT_GenerateLights(bpy.types.Operator):
                 z = random.uniform(z_range[0], z_range[1])
             return (x, y, z)
 
-        def spawn_inner_points(box_name):
-            # Get active camera
-            camera = bpy.context.scene.camera
-            if camera is None:
-                print("No active camera found.")
-                return
-            
-            # Get the bounding box object
-            bounding_box = bpy.data.objects[box_name]
-            if bounding_box is None or bounding_box.type != 'MESH':
-                print("No active bounding box mesh object found.")
-                return
-
+        def get_inner_points(bounds, camera):
             # Get bounding box dimensions
-            min_x, max_x, min_y, max_y, min_z, max_z = get_bounding_box_dimensions(bounding_box)
+            min_x, max_x, min_y, max_y, min_z, max_z = bounds.dimensions()
             z_span = max_z - min_z
 
             # Point 1: Closest to the camera, 70% to 100% of the z-height
             z_range1 = (min_z + 0.7 * z_span, max_z)
             point_1 = generate_random_point_within_bounds(min_x, max_x, min_y, max_y, z_range1)
-            spawn_point(point_1, "Point_1")
 
             # Point 2: Farthest from the camera, 60% to 80% of the z-height
             z_range2 = (min_z + 0.6 * z_span, min_z + 0.8 * z_span)
             point_2 = generate_random_point_within_bounds(min_x, max_x, min_y, max_y, z_range2)
-            spawn_point(point_2, "Point_2")
 
             # Point 3: Right side of the box w.r.t the camera, 40% to 60% of the z-height
             if camera.location.x > (min_x + max_x) / 2:
@@ -289,34 +756,20 @@ class LIGHTING_OT_GenerateLights(bpy.types.Operator):
                 x_range3 = (min_x, min_x + 0.5 * (max_x - min_x))
             z_range3 = (min_z + 0.4 * z_span, min_z + 0.6 * z_span)
             point_3 = generate_random_point_within_bounds(x_range3[0], x_range3[1], min_y, max_y, z_range3)
-            spawn_point(point_3, "Point_3")
-
-        def spawn_outer_points(box_name):
-            # Get active camera
-            camera = bpy.context.scene.camera
-            if camera is None:
-                print("No active camera found.")
-                return
-            
-            # Get the bounding box object
-            bounding_box = bpy.data.objects[box_name]
-            if bounding_box is None or bounding_box.type != 'MESH':
-                print("No active bounding box mesh object found.")
-                return
+            return [point_1, point_2, point_3]
 
+        def get_outer_points(bounds, camera):
             # Get bounding box dimensions
-            min_x, max_x, min_y, max_y, min_z, max_z = get_bounding_box_dimensions(bounding_box)
+            min_x, max_x, min_y, max_y, min_z, max_z = bounds.dimensions()
             z_span = max_z - min_z
 
             # Point2_1: Closest to the camera, 70% to 100% of the z-height
             z_range1 = (min_z + 0.7 * z_span, max_z)
             point2_1 = generate_random_surface_point(min_x, max_x, min_y, max_y, z_range1, surface='z')
-            spawn_point(point2_1, "Point2_1")
 
             # Point2_2: Farthest from the camera, 60% to 80% of the z-height
             z_range2 = (min_z + 0.6 * z_span, min_z + 0.8 * z_span)
             point2_2 = generate_random_surface_point(min_x, max_x, min_y, max_y, z_range2, surface='z')
-            spawn_point(point2_2, "Point2_2")
 
             # Point2_3: Right side of the box w.r.t the camera, 40% to 60% of the z-height
             if camera.location.x > (min_x + max_x) / 2:
@@ -325,76 +778,86 @@ class LIGHTING_OT_GenerateLights(bpy.types.Operator):
             else:
                 # Camera is to the right, place point on the left surface
                 point2_3 = generate_random_surface_point(min_x, max_x, min_y, max_y, (min_z + 0.4 * z_span, min_z + 0.6 * z_span), surface='x')
-            spawn_point(point2_3, "Point2_3")
-
+            return [point2_1, point2_2, point2_3]
 
 
-        def create_light_at_point(location, target_name, light_name):
+        def create_light_at_point(location, target_location, light_name):
             # Add an area light at the specified location
-            bpy.ops.object.light_add(type='AREA', location=location)
-            light = bpy.context.object
-            light.name = light_name
-            light.data.energy = 1000
-            light.data.size = 1.0
+            light_data = bpy.data.lights.new(light_name, type='AREA')
+            light_data.energy = 1000
+            light_data.size = 1.0
+            light = bpy.data.objects.new(light_name, light_data)
+            light.location = location
             light.show_name = True
 
-            # Get the target object
-            target = bpy.data.objects.get(target_name)
-            if target is None:
-                print(f"Target object {target_name} not found.")
-                return
-
             # Point the light towards the target
-            direction = mathutils.Vector(target.location) - mathutils.Vector(location)
+            direction = mathutils.Vector(target_location) - mathutils.Vector(location)
             rot_quat = direction.to_track_quat('-Z', 'Y')
             light.rotation_euler = rot_quat.to_euler()
             
             return light
 
-        def create_lights():
-            # Define the point and light names
-            point_names = ["Point2_1", "Point2_2", "Point2_3"]
-            target_names = ["Point_1", "Point_2", "Point_3"]
+        def create_lights(prefix, points, targets):
             light_names = ["MyLight_1", "MyLight_2", "MyLight_3"]
 
-            for point_name, target_name, light_name in zip(point_names, target_names, light_names):
-                # Get the point object
-                point = bpy.data.objects.get(point_name)
-                if point is None:
-                    print(f"Point object {point_name} not found.")
-                    continue
-
+            for point, target, light_name in zip(points, targets, light_names):
                 # Create light at the point location facing the target
-                create_light_at_point(point.location, target_name, light_name)
+                light = create_light_at_point(point, target, prefix + light_name)
+                add_rig_object(light, context.scene, prefix, light_name)
 
+        def spawn_points(prefix, points, targets):
+            point_names = ["Point2_1", "Point2_2", "Point2_3"]
+            target_names = ["Point_1", "Point_2", "Point_3"]
+            for location, name in zip(points + targets, point_names + target_names):
+                marker = spawn_point(location, prefix + name)
+                add_rig_object(marker, context.scene, prefix, name)
 
-        def delete_points():
+        def get_existing_rigs():
+            # Lights and point markers grouped by rig; the bounds boxes are left alone
             point_names = ["Point2_1", "Point2_2", "Point2_3"]
             target_names = ["Point_1", "Point_2", "Point_3"]
-            my_object_names = point_names + target_names 
-            all_object_names = [o.name for o in bpy.data.objects]
-
-            for ob_name in my_object_names:
-                if ob_name in all_object_names:
-                    ob = bpy.data.objects[ob_name]
-                    if ob.type == 'MESH':
-                        bpy.data.meshes.remove(ob.data)
-                        
-        def delete_lights():
             light_names = ["MyLight_1", "MyLight_2", "MyLight_3"]
-            all_object_names = [o.name for o in bpy.data.objects]
-            for ob_name in light_names:
-                if ob_name in all_object_names:
-                    ob = bpy.data.objects[ob_name]
-                    if ob.type == 'LIGHT':
-                        bpy.data.lights.remove(ob.data)
-                    
-        delete_lights()
-        spawn_inner_points("BoundingBoxCube")
-        spawn_outer_points("LightDomain")
-        create_lights()
-        delete_points()
-        self.report({'INFO'}, "Generate Lights executed")
+            existing_rigs = {}
+            for ob in get_rig_objects(context.scene, roles=point_names + target_names + light_names):
+                existing_rigs.setdefault(ob["three_point_rig"], []).append(ob)
+            return existing_rigs
+
+        camera = context.scene.camera
+        if camera is None:
+            self.report({'WARNING'}, "No active camera found")
+            return {'CANCELLED'}
+
+        props = context.scene.three_point_lighter
+        if props.batch_mode:
+            # Rig names are namespaced by their root so several rigs can coexist
+            rigs = [(root, root.name + "_") for root in get_root_objects(context.selected_objects)]
+        else:
+            rigs = [(context.object, "")] if context.object else []
+
+        # Compute every rig's bounds up front; shared meshes are read once via the cache
+        with profile_stage("bounds"):
+            # Several rigs share one read of every object's matrix_world
+            snapshot = TransformSnapshot() if len(rigs) > 1 else None
+            rigs = [(root, prefix, get_hierarchy_bounds(root, snapshot)) for root, prefix in rigs]
+        rigs = [rig for rig in rigs if rig[2] is not None]
+        if not rigs:
+            self.report({'WARNING'}, "No mesh found in the selected hierarchy")
+            return {'CANCELLED'}
+
+        with profile_stage("cleanup"):
+            existing_rigs = get_existing_rigs()
+        for root, prefix, bounds in rigs:
+            with profile_stage("cleanup"):
+                remove_rig_objects(existing_rigs.get(prefix, []))
+            with profile_stage("placement"):
+                targets = get_inner_points(bounds, camera)
+                points = get_outer_points(bounds.scaled_from_base(*LIGHT_DOMAIN_SCALE), camera)
+            with profile_stage("light creation"):
+                create_lights(prefix, points, targets)
+            if props.show_points:
+                with profile_stage("point markers"):
+                    spawn_points(prefix, points, targets)
+        self.report({'INFO'}, f"Generate Lights executed for {len(rigs)} rig(s)")
         return {'FINISHED'}
 
 class LIGHTING_OT_UpdateLights(bpy.types.Operator):
@@ -402,22 +865,21 @@ class LIGHTING_OT_UpdateLights(bpy.types.Operator):
     bl_label = "Update Lights"
     bl_description = "Update the lights"
 
+    @profiled
     def execute(self, context):
-        scene = bpy.context.scene
-        light_names = ["MyLight_1", "MyLight_2", "MyLight_3"]
-        all_object_names = [o.name for o in bpy.data.objects]
-        if 'MyLight_1' in all_object_names:
-            light_1 = bpy.data.objects['MyLight_1']
-            light_1.data.type = scene.three_point_lighter.light1_type
-            light_1.data.color = scene.three_point_lighter.light1_color
-        if 'MyLight_2' in all_object_names:
-            light_2 = bpy.data.objects['MyLight_2']
-            light_2.data.type = scene.three_point_lighter.light2_type
-            light_2.data.color = scene.three_point_lighter.light2_color
-        if 'MyLight_3' in all_object_names:
-            light_3 = bpy.data.objects['MyLight_3']
-            light_3.data.type = scene.three_point_lighter.light3_type
-            light_3.data.color = scene.three_point_lighter.light3_color  
+        props = bpy.context.scene.three_point_lighter
+        light_settings = {
+            "MyLight_1": (props.light1_type, props.light1_color),
+            "MyLight_2": (props.light2_type, props.light2_color),
+            "MyLight_3": (props.light3_type, props.light3_color),
+        }
+        # Update the matching light of every rig
+        with profile_stage("update"):
+            for ob in get_rig_objects(context.scene, roles=light_settings):
+                settings = light_settings[ob["three_point_role"]]
+                if ob.type == 'LIGHT':
+                    ob.data.type = settings[0]
+                    ob.data.color = settings[1]
         self.report({'INFO'}, "Update Lights executed")
         return {'FINISHED'}
 
@@ -426,26 +888,26 @@ class LIGHTING_OT_RemoveLights(bpy.types.Operator):
     bl_label = "Remove Lights"
     bl_description = "Remove the lights"
 
+    @profiled
     def execute(self, context):
-        boxes = ["BoundingBoxCube", "LightDomain"]
-        point_names = ["Point2_1", "Point2_2", "Point2_3"]
-        target_names = ["Point_1", "Point_2", "Point_3"]
-        light_names = ["MyLight_1", "MyLight_2", "MyLight_3"]
-
-        my_object_names = point_names + target_names + light_names + boxes
-        all_object_names = [o.name for o in bpy.data.objects]
-
-        for ob_name in my_object_names:
-            if ob_name in all_object_names:
-                ob = bpy.data.objects[ob_name]
-                if ob.type == 'MESH':
-                    bpy.data.meshes.remove(ob.data)
-                elif ob.type == 'LIGHT':
-                    bpy.data.lights.remove(ob.data)
-                
+        with profile_stage("cleanup"):
+            remove_rig_objects(get_rig_objects(context.scene))
+
         self.report({'INFO'}, "Remove Lights executed")
         return {'FINISHED'}
 
+class OBJECT_PT_ThreePointLighterProfiling(bpy.types.Panel):
+    bl_label = "Profiling"
+    bl_idname = "OBJECT_PT_ThreePointLighterProfiling"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = '3 Point Lighter'
+    bl_parent_id = "OBJECT_PT_ThreePointLighterPanel"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        draw_profiles(self.layout, context)
+
 def register():
     bpy.utils.register_class(ThreePointLighterProperties)
     bpy.utils.register_class(OBJECT_PT_ThreePointLighterPanel)
@@ -453,16 +915,33 @@ def register():
     bpy.utils.register_class(LIGHTING_OT_GenerateLights)
     bpy.utils.register_class(LIGHTING_OT_UpdateLights)
     bpy.utils.register_class(LIGHTING_OT_RemoveLights)
+    bpy.utils.register_class(OBJECT_PT_ThreePointLighterProfiling)
     bpy.types.Scene.three_point_lighter = bpy.props.PointerProperty(type=ThreePointLighterProperties)
+    register_profiling()
+    # Keep the hierarchy index and the cached mesh stats current between operator runs
+    handlers = bpy.app.handlers
+    handlers.depsgraph_update_post.append(three_point_lighter_on_depsgraph_update)
+    for handler_list in (handlers.load_post, handlers.undo_post, handlers.redo_post):
+        handler_list.append(three_point_lighter_on_data_reloaded)
+    handlers.load_post.append(three_point_lighter_on_load_post)
 
 def unregister():
     bpy.utils.unregister_class(ThreePointLighterProperties)
+    bpy.utils.unregister_class(OBJECT_PT_ThreePointLighterProfiling)
     bpy.utils.unregister_class(OBJECT_PT_ThreePointLighterPanel)
     bpy.utils.unregister_class(LIGHTING_OT_VisualizeBounds)
     bpy.utils.unregister_class(LIGHTING_OT_GenerateLights)
     bpy.utils.unregister_class(LIGHTING_OT_UpdateLights)
     bpy.utils.unregister_class(LIGHTING_OT_RemoveLights)
     del bpy.types.Scene.three_point_lighter
+    unregister_profiling()
+    handlers = bpy.app.handlers
+    handlers.depsgraph_update_post.remove(three_point_lighter_on_depsgraph_update)
+    for handler_list in (handlers.load_post, handlers.undo_post, handlers.redo_post):
+        handler_list.remove(three_point_lighter_on_data_reloaded)
+    handlers.load_post.remove(three_point_lighter_on_load_post)
+    _hierarchy_index.dirty = True
+    clear_mesh_cache()
 
 if __name__ == "__main__":
     register()
@@ -1,19 +1,151 @@
 import bpy
+from bpy.app.handlers import persistent
 
-root = bpy.context.object
-parent_child_dict = {}
+# A text block starts from scratch on every run; the hierarchy index is kept here so it outlives a run
+_session = bpy.app.driver_namespace.setdefault("Q3_ParentChildDict", {})
 
-def recurse(parent):
-    if parent.children:
-        children = parent.children
-        parent_child_dict[parent.name] = [o.name for o in children]
-        for ob in children:
-            if ob.children:
-                recurse(ob)
+# --- shared block "hierarchy_index": generated from shared/hierarchy_index.py by shared/sync.py, edit it there ---
+class HierarchyIndex:
+    """Parent and children of every object in bpy.data, kept current from depsgraph updates.
+
+    The attributes are stored in state, so a text block can pass a dict kept
+    in bpy.app.driver_namespace and keep the index across runs.
+    """
+
+    def __init__(self, state=None):
+        self.__dict__ = {} if state is None else state
+        if "parent" not in self.__dict__:
+            self.parent = {}
+            self.children = {}
+            self.dirty = True
+
+    def rebuild(self):
+        self.parent = {}
+        self.children = {}
+        for ob in bpy.data.objects:
+            self._add(ob)
+        self.dirty = False
+
+    def _add(self, ob):
+        self.parent[ob] = ob.parent
+        if ob.parent is not None:
+            self.children.setdefault(ob.parent, []).append(ob)
+
+    def _remove(self, ob):
+        parent = self.parent.pop(ob)
+        if parent is not None:
+            siblings = self.children[parent]
+            siblings.remove(ob)
+            if not siblings:
+                del self.children[parent]
+
+    def update_object(self, ob):
+        if ob in self.parent:
+            if self.parent[ob] == ob.parent:
+                return
+            self._remove(ob)
+        self._add(ob)
+
+    def update(self, depsgraph):
+        # Added and re-parented objects are reported; removed ones are not
+        if self.dirty:
+            return
+        for update in depsgraph.updates:
+            if isinstance(update.id, bpy.types.Object):
+                self.update_object(update.id.original)
+
+    def ensure(self, tracked=True):
+        # Untracked means no handler keeps the index current, so it is rebuilt for every query.
+        # A changed object count catches removals; _get_valid_children catches those the count hides.
+        if self.dirty or not tracked or len(self.parent) != len(bpy.data.objects):
+            self.rebuild()
+        return self
+
+    def _get_valid_children(self, ob):
+        # A removal paired with an unseen addition keeps the count; the removed child then raises
+        # ReferenceError, or its reused pointer reports another parent
+        children = self.children.get(ob, ())
+        try:
+            valid = all(child.parent == ob for child in children)
+        except ReferenceError:
+            valid = False
+        if not valid:
+            self.rebuild()
+            children = self.children.get(ob, ())
+        return children
+
+    def get_children(self, ob):
+        # Name order, the same after any edit history; the lists themselves follow update order
+        return sorted(self._get_valid_children(ob), key=lambda child: child.name)
+
+    def descendants(self, ob):
+        # Depth-first, same set of objects as ob.children_recursive
+        result = []
+        stack = list(reversed(self._get_valid_children(ob)))
+        while stack:
+            child = stack.pop()
+            result.append(child)
+            stack.extend(reversed(self._get_valid_children(child)))
+        return result
+# --- end of shared block "hierarchy_index" ---
+
+_hierarchy_index = HierarchyIndex(_session.setdefault("hierarchy_index", {}))
+
+def get_hierarchy_index():
+    # Without the handler nothing keeps the index current
+    return _hierarchy_index.ensure(q3_on_depsgraph_update in bpy.app.handlers.depsgraph_update_post)
+
+def build_parent_child_dict(objects, root=None):
+    """Map parent names to child names for root's subtree, or for all of objects.
+
+    Children come from the hierarchy index, so only the subtree is visited,
+    in name order, with an explicit stack; arbitrarily deep hierarchies are
+    fine. Only objects with children get an entry.
+    """
+    index = get_hierarchy_index()
+    if root is None:
+        roots = [ob for ob in objects if ob.parent is None]
+    else:
+        roots = [root]
+
+    parent_child_dict = {}
+    stack = list(reversed(roots))
+    while stack:
+        ob = stack.pop()
+        ob_children = index.get_children(ob)
+        if ob_children:
+            parent_child_dict[ob.name] = [child.name for child in ob_children]
+            stack.extend(reversed(ob_children))
     return parent_child_dict
 
-print(recurse(root)) 
+@persistent
+def q3_on_depsgraph_update(scene, depsgraph):
+    _hierarchy_index.update(depsgraph)
+
+@persistent
+def q3_on_data_reloaded(*args):
+    # Undo, redo and file loads replace every object, so the stored references are stale
+    _hierarchy_index.dirty = True
+
+# --- shared block "set_handler": generated from shared/set_handler.py by shared/sync.py, edit it there ---
+def set_handler(handler_list, handler):
+    # Every run of a text block defines new functions; drop the ones left by earlier runs
+    for old in [h for h in handler_list if getattr(h, "__name__", None) == handler.__name__]:
+        handler_list.remove(old)
+    handler_list.append(handler)
+# --- end of shared block "set_handler" ---
+
+def register():
+    # Keep the hierarchy index current between runs
+    handlers = bpy.app.handlers
+    set_handler(handlers.depsgraph_update_post, q3_on_depsgraph_update)
+    for handler_list in (handlers.load_post, handlers.undo_post, handlers.redo_post):
+        set_handler(handler_list, q3_on_data_reloaded)
+
 
+if __name__ == "__main__":
+    register()
+    root = bpy.context.object
 
-        
-            
\ No newline at end of file
+    # Pass root=None for every hierarchy in the scene
+    print(build_parent_child_dict(bpy.context.scene.objects, root))
@@ -8,10 +8,496 @@ bl_info = {
     "category": "Object",
 }
 
+import os
 import bpy
 import json
-import os
-import math
+import time
+import functools
+import tracemalloc
+import numpy as np
+from contextlib import contextmanager
+from bpy.app.handlers import persistent
+
+# Buffer size of the output file; records are written as soon as they are built
+WRITE_BUFFER_SIZE = 1024 * 1024
+OUTPUT_EXTENSIONS = {'JSON': ".json", 'NDJSON': ".ndjson", 'COLUMNAR': ".colbin"}
+
+# Switch and log name of the shared profiling block below
+PROFILING_PROPERTY = "json_object_info_profiling"
+PROFILE_LOG_NAME = "json_object_info_profile.json"
+
+# --- shared block "profiling": generated from shared/profiling.py by shared/sync.py, edit it there ---
+# Opt-in operator profiling, switched on by the WindowManager property named PROFILING_PROPERTY.
+# Runs are appended to the rolling log PROFILE_LOG_NAME in Blender's user config directory.
+MAX_PROFILE_ENTRIES = 500
+# Profile of the operator currently running; nested operators are folded into it
+_active_profile = None
+# Last profile per operator, shown in the Profiling subpanel
+_last_profiles = {}
+
+class OperatorProfile:
+    """Wall time per stage, bpy.ops calls and tracemalloc peak of one operator run."""
+
+    def __init__(self, operator):
+        self.operator = operator
+        self.started = time.time()
+        self.seconds = 0.0
+        self.stages = {}
+        self.ops_calls = None
+        self.peak_bytes = 0
+        self.result = None
+
+def get_profile_log_path():
+    return os.path.join(bpy.utils.user_resource('CONFIG'), PROFILE_LOG_NAME)
+
+@contextmanager
+def profile_stage(name):
+    # Stages with the same name add up, so a stage can be entered once per file or per rig
+    profile = _active_profile
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        if profile is not None:
+            profile.stages[name] = profile.stages.get(name, 0.0) + time.perf_counter() - start
+
+def count_ops_calls(profile):
+    # bpy.ops operators are called through this class; returns a function that undoes the patch
+    op_class = getattr(bpy.ops, "_BPyOpsSubModOp", None)
+    if op_class is None:
+        return lambda: None
+    original = op_class.__call__
+
+    def counted_call(self, *args, **kwargs):
+        profile.ops_calls += 1
+        return original(self, *args, **kwargs)
+
+    profile.ops_calls = 0
+    op_class.__call__ = counted_call
+
+    def restore():
+        op_class.__call__ = original
+    return restore
+
+def finish_profile(profile, result):
+    # Shows the profile in the subpanel and appends it to the log
+    profile.result = None if result is None else sorted(result)
+    _last_profiles[profile.operator] = profile
+    path = get_profile_log_path()
+    try:
+        with open(path) as f:
+            entries = json.load(f)
+    except (OSError, ValueError):
+        entries = []
+    entries.append(vars(profile))
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(entries[-MAX_PROFILE_ENTRIES:], f, indent=1)
+    except OSError as e:
+        print(f"Could not write operator profile log {path}: {e}")
+
+def profiled(execute):
+    """Decorator for Operator.execute; records a profile when profiling is switched on.
+
+    If execute returns RUNNING_MODAL the profile is left open as self._profile;
+    the modal part adds to it and hands it to finish_profile when it is done.
+    """
+    @functools.wraps(execute)
+    def wrapper(self, context):
+        global _active_profile
+        if _active_profile is not None or not getattr(context.window_manager, PROFILING_PROPERTY, False):
+            return execute(self, context)
+
+        profile = OperatorProfile(self.bl_idname)
+        _active_profile = profile
+        restore_ops = count_ops_calls(profile)
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        else:
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+        result = None
+        try:
+            result = execute(self, context)
+            return result
+        finally:
+            profile.seconds = time.perf_counter() - start
+            profile.peak_bytes = tracemalloc.get_traced_memory()[1]
+            if started_tracing:
+                tracemalloc.stop()
+            restore_ops()
+            _active_profile = None
+            if result is not None and 'RUNNING_MODAL' in result:
+                self._profile = profile
+            else:
+                finish_profile(profile, result)
+    return wrapper
+
+def draw_profiles(layout, context):
+    layout.prop(context.window_manager, PROFILING_PROPERTY)
+    for profile in _last_profiles.values():
+        box = layout.box()
+        ops_calls = "n/a" if profile.ops_calls is None else profile.ops_calls
+        box.label(text=f"{profile.operator}: {profile.seconds:.3f}s")
+        box.label(text=f"bpy.ops calls: {ops_calls}, peak: {profile.peak_bytes / 2**20:.1f} MiB")
+        col = box.column(align=True)
+        for name, seconds in profile.stages.items():
+            col.label(text=f"{name}: {seconds:.3f}s")
+    if _last_profiles:
+        layout.label(text=f"Log: {get_profile_log_path()}")
+
+def register_profiling():
+    setattr(bpy.types.WindowManager, PROFILING_PROPERTY, bpy.props.BoolProperty(
+        name="Profile Operators",
+        description="Record stage timings, bpy.ops calls and peak memory of this addon's operators",
+        default=False,
+    ))
+
+def unregister_profiling():
+    delattr(bpy.types.WindowManager, PROFILING_PROPERTY)
+# --- end of shared block "profiling" ---
+
+# --- shared block "hierarchy_index": generated from shared/hierarchy_index.py by shared/sync.py, edit it there ---
+class HierarchyIndex:
+    """Parent and children of every object in bpy.data, kept current from depsgraph updates.
+
+    The attributes are stored in state, so a text block can pass a dict kept
+    in bpy.app.driver_namespace and keep the index across runs.
+    """
+
+    def __init__(self, state=None):
+        self.__dict__ = {} if state is None else state
+        if "parent" not in self.__dict__:
+            self.parent = {}
+            self.children = {}
+            self.dirty = True
+
+    def rebuild(self):
+        self.parent = {}
+        self.children = {}
+        for ob in bpy.data.objects:
+            self._add(ob)
+        self.dirty = False
+
+    def _add(self, ob):
+        self.parent[ob] = ob.parent
+        if ob.parent is not None:
+            self.children.setdefault(ob.parent, []).append(ob)
+
+    def _remove(self, ob):
+        parent = self.parent.pop(ob)
+        if parent is not None:
+            siblings = self.children[parent]
+            siblings.remove(ob)
+            if not siblings:
+                del self.children[parent]
+
+    def update_object(self, ob):
+        if ob in self.parent:
+            if self.parent[ob] == ob.parent:
+                return
+            self._remove(ob)
+        self._add(ob)
+
+    def update(self, depsgraph):
+        # Added and re-parented objects are reported; removed ones are not
+        if self.dirty:
+            return
+        for update in depsgraph.updates:
+            if isinstance(update.id, bpy.types.Object):
+                self.update_object(update.id.original)
+
+    def ensure(self, tracked=True):
+        # Untracked means no handler keeps the index current, so it is rebuilt for every query.
+        # A changed object count catches removals; _get_valid_children catches those the count hides.
+        if self.dirty or not tracked or len(self.parent) != len(bpy.data.objects):
+            self.rebuild()
+        return self
+
+    def _get_valid_children(self, ob):
+        # A removal paired with an unseen addition keeps the count; the removed child then raises
+        # ReferenceError, or its reused pointer reports another parent
+        children = self.children.get(ob, ())
+        try:
+            valid = all(child.parent == ob for child in children)
+        except ReferenceError:
+            valid = False
+        if not valid:
+            self.rebuild()
+            children = self.children.get(ob, ())
+        return children
+
+    def get_children(self, ob):
+        # Name order, the same after any edit history; the lists themselves follow update order
+        return sorted(self._get_valid_children(ob), key=lambda child: child.name)
+
+    def descendants(self, ob):
+        # Depth-first, same set of objects as ob.children_recursive
+        result = []
+        stack = list(reversed(self._get_valid_children(ob)))
+        while stack:
+            child = stack.pop()
+            result.append(child)
+            stack.extend(reversed(self._get_valid_children(child)))
+        return result
+# --- end of shared block "hierarchy_index" ---
+
+_hierarchy_index = HierarchyIndex()
+
+def get_hierarchy_index():
+    # Without the handler nothing keeps the index current
+    return _hierarchy_index.ensure(json_object_info_on_depsgraph_update in bpy.app.handlers.depsgraph_update_post)
+
+@persistent
+def json_object_info_on_depsgraph_update(scene, depsgraph):
+    _hierarchy_index.update(depsgraph)
+
+@persistent
+def json_object_info_on_data_reloaded(*args):
+    # Undo, redo and file loads replace every object, so the stored references are stale
+    _hierarchy_index.dirty = True
+
+# --- shared block "root_objects": generated from shared/root_objects.py by shared/sync.py, edit it there ---
+def get_root_objects(objects):
+    # Objects that have no ancestor in the given set
+    selected = set(objects)
+    roots = []
+    for ob in objects:
+        parent = ob.parent
+        while parent is not None and parent not in selected:
+            parent = parent.parent
+        if parent is None:
+            roots.append(ob)
+    return roots
+# --- end of shared block "root_objects" ---
+
+def build_hierarchy_tables(roots, index):
+    """Number the subtrees of roots depth-first in a single traversal.
+
+    Returns (objects, parent, first_child, next_sibling) where the last three
+    are lists of indices into objects, -1 meaning none. Roots are chained
+    through next_sibling starting at index 0. Children are visited in name
+    order, so ids do not depend on the order the index saw them in.
+    """
+    objects = []
+    parent = []
+    first_child = []
+    next_sibling = []
+    last_child = {}
+    stack = [(root, -1) for root in reversed(roots)]
+    while stack:
+        ob, parent_id = stack.pop()
+        i = len(objects)
+        objects.append(ob)
+        parent.append(parent_id)
+        first_child.append(-1)
+        next_sibling.append(-1)
+
+        previous = last_child.get(parent_id)
+        if previous is not None:
+            next_sibling[previous] = i
+        elif parent_id >= 0:
+            first_child[parent_id] = i
+        last_child[parent_id] = i
+
+        stack.extend((child, i) for child in reversed(index.get_children(ob)))
+    return objects, parent, first_child, next_sibling
+
+# --- shared block "transforms": generated from shared/transforms.py by shared/sync.py, edit it there ---
+# Floats per object of every transform attribute read_transforms can bulk-read
+TRANSFORM_SIZES = {"matrix_world": 16, "location": 3, "rotation_euler": 3, "scale": 3}
+# Up to this many objects, reading them one by one is cheaper than a pass over bpy.data.objects
+PER_OBJECT_LIMIT = 256
+
+class TransformSnapshot:
+    """Transforms of every object in bpy.data, read with one foreach_get per attribute on first use."""
+
+    def __init__(self):
+        self.objects = bpy.data.objects
+        self.rows = {ob: i for i, ob in enumerate(self.objects)}
+        self.arrays = {}
+
+    def read(self, attr):
+        array = self.arrays.get(attr)
+        if array is None:
+            flat = np.empty(len(self.objects) * TRANSFORM_SIZES[attr], dtype=np.float32)
+            self.objects.foreach_get(attr, flat)
+            if attr == "matrix_world":
+                # RNA stores matrices column by column
+                array = flat.reshape(-1, 4, 4).transpose(0, 2, 1)
+            else:
+                array = flat.reshape(-1, 3)
+            self.arrays[attr] = array
+        return array
+
+def read_transforms(objects, attributes, snapshot=None):
+    """Transforms of objects as float32 arrays keyed by attribute; row i belongs to objects[i].
+
+    matrix_world is (n, 4, 4) in row-major (mathutils) order, the others are
+    (n, 3). Pass a TransformSnapshot to share one read of the file between calls.
+    """
+    objects = list(objects)
+    if snapshot is None and len(objects) <= PER_OBJECT_LIMIT:
+        arrays = {}
+        for attr in attributes:
+            shape = (len(objects), 4, 4) if attr == "matrix_world" else (len(objects), 3)
+            array = np.empty(shape, dtype=np.float32)
+            for i, ob in enumerate(objects):
+                array[i] = getattr(ob, attr)
+            arrays[attr] = array
+        return arrays
+
+    if snapshot is None:
+        snapshot = TransformSnapshot()
+    rows = np.fromiter((snapshot.rows[ob] for ob in objects), dtype=np.intp, count=len(objects))
+    return {attr: snapshot.read(attr)[rows] for attr in attributes}
+# --- end of shared block "transforms" ---
+
+# Files written here are read outside Blender with colbin_reader.py, next to this addon
+# --- shared block "columnar": generated from shared/columnar.py by shared/sync.py, edit it there ---
+# Columnar layout: MAGIC | header length (uint64, little endian) | JSON header | padding | arrays.
+# Every array starts on a COLUMNAR_ALIGNMENT boundary so readers can memory-map it directly.
+COLUMNAR_MAGIC = b"COLSCN01"
+COLUMNAR_ALIGNMENT = 64
+
+def align_columnar_offset(offset):
+    return (offset + COLUMNAR_ALIGNMENT - 1) // COLUMNAR_ALIGNMENT * COLUMNAR_ALIGNMENT
+# --- end of shared block "columnar" ---
+
+def write_columnar(path, arrays, metadata=None):
+    # arrays: dict of name -> numpy array; offsets are relative to the start of the data section
+    arrays = {name: np.ascontiguousarray(array) for name, array in arrays.items()}
+    entries = {}
+    offset = 0
+    for name, array in arrays.items():
+        entries[name] = {"dtype": array.dtype.str, "shape": list(array.shape), "offset": offset}
+        offset = align_columnar_offset(offset + array.nbytes)
+
+    header = json.dumps({"metadata": metadata or {}, "arrays": entries}).encode("utf-8")
+    data_start = align_columnar_offset(len(COLUMNAR_MAGIC) + 8 + len(header))
+    with open(path, "wb") as f:
+        f.write(COLUMNAR_MAGIC)
+        f.write(len(header).to_bytes(8, "little"))
+        f.write(header)
+        f.write(b"\0" * (data_start - f.tell()))
+        for name, array in arrays.items():
+            f.write(b"\0" * (data_start + entries[name]["offset"] - f.tell()))
+            f.write(array.tobytes())
+
+def read_record_transforms(objects):
+    # Location, rotation in degrees and scale of every object as float64 arrays;
+    # rows are turned into Python floats one record at a time so memory stays flat while streaming
+    transforms = read_transforms(objects, ("location", "rotation_euler", "scale"))
+    location = transforms["location"].astype(np.float64)
+    rotation = np.degrees(transforms["rotation_euler"].astype(np.float64))
+    scale = transforms["scale"].astype(np.float64)
+    return location, rotation, scale
+
+def iter_object_records(objects, index):
+    location, rotation, scale = read_record_transforms(objects)
+    for i, ob in enumerate(objects):
+        yield {
+            "object_name" : ob.name,
+            "location" : location[i].tolist(),
+            "rotation" : rotation[i].tolist(),
+            "scale" : scale[i].tolist(),
+            "parent" : ob.parent.name if ob.parent else None,
+            "children" : [ch.name for ch in index.get_children(ob)]
+        }
+
+def iter_hierarchy_records(objects, parent, first_child, next_sibling):
+    # Ids are positions in objects; parent and child links are ids, -1 meaning none
+    location, rotation, scale = read_record_transforms(objects)
+    for i, ob in enumerate(objects):
+        yield {
+            "id" : i,
+            "object_name" : ob.name,
+            "location" : location[i].tolist(),
+            "rotation" : rotation[i].tolist(),
+            "scale" : scale[i].tolist(),
+            "parent" : parent[i],
+            "first_child" : first_child[i],
+            "next_sibling" : next_sibling[i]
+        }
+
+def write_records(outfile, records, output_format='JSON', compact=False):
+    # Stream records one at a time so only a single record is held as text
+    if output_format == 'NDJSON':
+        for record in records:
+            outfile.write(json.dumps(record, separators=(",", ":")) + "\n")
+        return
+
+    if compact:
+        opening, separator, closing = "[", ",", "]"
+        dump = lambda record: json.dumps(record, separators=(",", ":"))
+    else:
+        # Same layout as json.dumps(records, indent=4)
+        opening, separator, closing = "[\n", ",\n", "\n]"
+        dump = lambda record: "    " + json.dumps(record, indent=4).replace("\n", "\n    ")
+
+    first = True
+    for record in records:
+        outfile.write(opening if first else separator)
+        outfile.write(dump(record))
+        first = False
+    outfile.write("[]" if first else closing)
+
+def write_columnar_scene(file_path, objects, hierarchy=None):
+    # Transforms as contiguous float32 columns, hierarchy as integer index arrays
+    count = len(objects)
+    transforms = read_transforms(objects, ("location", "rotation_euler", "scale"))
+    location = transforms["location"]
+    rotation = np.degrees(transforms["rotation_euler"])
+    scale = transforms["scale"]
+    if hierarchy is not None:
+        parent = np.array(hierarchy[0], dtype=np.int32)
+    else:
+        index = {ob: i for i, ob in enumerate(objects)}
+        parent = np.array([index.get(ob.parent, -1) for ob in objects], dtype=np.int32)
+
+    # Children of object i are child_indices[child_offsets[i]:child_offsets[i + 1]]
+    child_indices = np.argsort(parent, kind="stable").astype(np.int32)
+    child_indices = child_indices[parent[child_indices] >= 0]
+    child_counts = np.bincount(parent[parent >= 0], minlength=count)
+    child_offsets = np.zeros(count + 1, dtype=np.int32)
+    np.cumsum(child_counts, out=child_offsets[1:])
+
+    arrays = {
+        "location": location,
+        "rotation": rotation,
+        "scale": scale,
+        "parent": parent,
+        "child_offsets": child_offsets,
+        "child_indices": child_indices,
+    }
+    if hierarchy is not None:
+        arrays["first_child"] = np.array(hierarchy[1], dtype=np.int32)
+        arrays["next_sibling"] = np.array(hierarchy[2], dtype=np.int32)
+    metadata = {"names": [ob.name for ob in objects], "rotation_units": "degrees"}
+    write_columnar(file_path, arrays, metadata)
+
+def write_object_info(file_path, selected_objects, output_format, compact=False, full_hierarchy=False):
+    # Everything Write Json does after picking the file; the benchmarks call it too
+    with profile_stage("hierarchy"):
+        if full_hierarchy:
+            # Ids, parent and sibling links all come from a single depth-first traversal
+            objects, parent, first_child, next_sibling = build_hierarchy_tables(get_root_objects(selected_objects), get_hierarchy_index())
+            hierarchy = (parent, first_child, next_sibling)
+            records = iter_hierarchy_records(objects, parent, first_child, next_sibling)
+        else:
+            objects = selected_objects
+            hierarchy = None
+            records = iter_object_records(objects, get_hierarchy_index())
+
+    # Records are generated lazily, so building them is part of the write stage
+    with profile_stage("write"):
+        if output_format == 'COLUMNAR':
+            write_columnar_scene(file_path, objects, hierarchy)
+        else:
+            with open(file_path, "w", buffering=WRITE_BUFFER_SIZE) as outfile:
+                write_records(outfile, records, output_format, compact)
 
 class JsonObjectInfoProperties(bpy.types.PropertyGroup):
     file_name: bpy.props.StringProperty(
@@ -20,34 +506,45 @@ class JsonObjectInfoProperties(bpy.types.PropertyGroup):
         default="json_filename",
         maxlen=1024,
     )
+    output_format: bpy.props.EnumProperty(
+        name="Format",
+        description="Layout of the written file",
+        items=[
+            ('JSON', "JSON", "A single JSON array of objects"),
+            ('NDJSON', "NDJSON", "One JSON object per line"),
+            ('COLUMNAR', "Columnar", "Binary float32 transform columns with a JSON header, for memory-mapping"),
+        ],
+        default='JSON',
+    )
+    compact: bpy.props.BoolProperty(
+        name="Compact",
+        description="Write JSON without indentation",
+        default=False,
+    )
+    full_hierarchy: bpy.props.BoolProperty(
+        name="Full Hierarchy",
+        description="Write the selected roots with all their descendants, linked by integer ids",
+        default=False,
+    )
 
 class OBJECT_OT_WriteJson(bpy.types.Operator):
     bl_idname = "object.write_json"
     bl_label = "Write Json"
     bl_description = "Write selected object info to a JSON file"
 
+    @profiled
     def execute(self, context):
         
-        json_file_name = bpy.context.scene.json_object_info.file_name
+        props = bpy.context.scene.json_object_info
+        json_file_name = props.file_name
+        extension = OUTPUT_EXTENSIONS[props.output_format]
 
         selected_objects = bpy.context.selected_objects
         blend_filepath = bpy.data.filepath
         blend_name = blend_filepath.split('\\')[-1]
         path =   blend_filepath.split(blend_name)[0]
-        json_data = []
-        with open(path+json_file_name+".json","w") as outfile:
-            for ob in selected_objects:
-                dictionary = {
-                    "object_name" : ob.name,
-                    "location" : (ob.location[0], ob.location[1], ob.location[2]),
-                    "rotation" : (math.degrees(ob.rotation_euler[0]) , math.degrees(ob.rotation_euler[1]) , math.degrees(ob.rotation_euler[2])),
-                    "scale" : (ob.scale[0], ob.scale[0], ob.scale[0]),
-                    "parent" : ob.parent.name if ob.parent else None,
-                    "children" : [ch.name for ch in ob.children]
-                }
-                json_data.append(dictionary)
-            json_object = json.dumps(json_data, indent = 4)
-            outfile.write(json_object)
+        write_object_info(path+json_file_name+extension, selected_objects, props.output_format,
+                          props.compact, props.full_hierarchy)
 
         self.report({'INFO'}, f"Object info written to {path}")
         return {'FINISHED'}
@@ -65,19 +562,49 @@ class OBJECT_PT_JsonObjectInfoPanel(bpy.types.Panel):
         props = scene.json_object_info
 
         layout.prop(props, "file_name")
+        layout.prop(props, "output_format", expand=True)
+        row = layout.row()
+        row.enabled = props.output_format == 'JSON'
+        row.prop(props, "compact")
+        layout.prop(props, "full_hierarchy")
         layout.operator("object.write_json", text="Write Json")
 
+class OBJECT_PT_JsonObjectInfoProfiling(bpy.types.Panel):
+    bl_label = "Profiling"
+    bl_idname = "OBJECT_PT_JsonObjectInfoProfiling"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = 'json_object_info'
+    bl_parent_id = "OBJECT_PT_JsonObjectInfoPanel"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        draw_profiles(self.layout, context)
+
 def register():
     bpy.utils.register_class(JsonObjectInfoProperties)
     bpy.utils.register_class(OBJECT_OT_WriteJson)
     bpy.utils.register_class(OBJECT_PT_JsonObjectInfoPanel)
+    bpy.utils.register_class(OBJECT_PT_JsonObjectInfoProfiling)
     bpy.types.Scene.json_object_info = bpy.props.PointerProperty(type=JsonObjectInfoProperties)
+    register_profiling()
+    handlers = bpy.app.handlers
+    handlers.depsgraph_update_post.append(json_object_info_on_depsgraph_update)
+    for handler_list in (handlers.load_post, handlers.undo_post, handlers.redo_post):
+        handler_list.append(json_object_info_on_data_reloaded)
 
 def unregister():
     bpy.utils.unregister_class(JsonObjectInfoProperties)
     bpy.utils.unregister_class(OBJECT_OT_WriteJson)
+    bpy.utils.unregister_class(OBJECT_PT_JsonObjectInfoProfiling)
     bpy.utils.unregister_class(OBJECT_PT_JsonObjectInfoPanel)
     del bpy.types.Scene.json_object_info
+    unregister_profiling()
+    handlers = bpy.app.handlers
+    handlers.depsgraph_update_post.remove(json_object_info_on_depsgraph_update)
+    for handler_list in (handlers.load_post, handlers.undo_post, handlers.redo_post):
+        handler_list.remove(json_object_info_on_data_reloaded)
+    _hierarchy_index.dirty = True
 
 if __name__ == "__main__":
     register()
@@ -0,0 +1,53 @@
+"""Read the .colbin files written by the json_object_info addon, without Blender.
+
+    python colbin_reader.py scene.colbin    # print the metadata and the shape of every array
+
+Only numpy is needed, so any tool can import read_columnar from this file.
+"""
+import sys
+import json
+import numpy as np
+
+# --- shared block "columnar": generated from shared/columnar.py by shared/sync.py, edit it there ---
+# Columnar layout: MAGIC | header length (uint64, little endian) | JSON header | padding | arrays.
+# Every array starts on a COLUMNAR_ALIGNMENT boundary so readers can memory-map it directly.
+COLUMNAR_MAGIC = b"COLSCN01"
+COLUMNAR_ALIGNMENT = 64
+
+def align_columnar_offset(offset):
+    return (offset + COLUMNAR_ALIGNMENT - 1) // COLUMNAR_ALIGNMENT * COLUMNAR_ALIGNMENT
+# --- end of shared block "columnar" ---
+
+def read_columnar(path, mmap=True):
+    # Returns (metadata, arrays); with mmap the arrays are read lazily from disk
+    with open(path, "rb") as f:
+        if f.read(len(COLUMNAR_MAGIC)) != COLUMNAR_MAGIC:
+            raise ValueError(f"{path} is not a columnar scene file")
+        header_length = int.from_bytes(f.read(8), "little")
+        header = json.loads(f.read(header_length).decode("utf-8"))
+        data_start = align_columnar_offset(len(COLUMNAR_MAGIC) + 8 + header_length)
+
+        arrays = {}
+        for name, entry in header["arrays"].items():
+            dtype = np.dtype(entry["dtype"])
+            shape = tuple(entry["shape"])
+            offset = data_start + entry["offset"]
+            if mmap and int(np.prod(shape)) > 0:
+                arrays[name] = np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=shape)
+            else:
+                f.seek(offset)
+                count = int(np.prod(shape))
+                arrays[name] = np.fromfile(f, dtype=dtype, count=count).reshape(shape)
+    return header["metadata"], arrays
+
+def main(paths):
+    for path in paths:
+        metadata, arrays = read_columnar(path)
+        print(path)
+        for key, value in metadata.items():
+            print(f"  {key}: {len(value)} entries" if isinstance(value, list) else f"  {key}: {value}")
+        for name, array in arrays.items():
+            print(f"  {name}: {array.dtype} {array.shape}")
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
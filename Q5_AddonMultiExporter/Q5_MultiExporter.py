@@ -10,6 +10,454 @@ bl_info = {
 
 import bpy
 import os
+import sys
+import json
+import time
+import queue
+import functools
+import tracemalloc
+import shutil
+import tempfile
+import hashlib
+import threading
+import subprocess
+import collections
+import numpy as np
+from contextlib import contextmanager
+
+# Lines printed by background workers that carry a per-file result
+RESULT_PREFIX = "MULTI_EXPORTER_RESULT "
+WORKER_FLAG = "--multi-exporter-worker"
+# Run by the workers when this addon is a Text Editor block rather than a file; the snapshot holds the block
+WORKER_STUB = "import bpy\nexec(compile(bpy.data.texts[{name!r}].as_string(), {name!r}, 'exec'), {{'__name__': '__main__'}})\n"
+# Hashes of the last export of every file, stored next to the exported files
+MANIFEST_NAME = ".multi_exporter_manifest.json"
+GEOMETRY_TYPES = {'MESH', 'CURVE', 'SURFACE', 'META', 'FONT'}
+# foreach_get field, dtype and values per element of every generic attribute type that gets hashed
+ATTRIBUTE_FIELDS = {
+    'FLOAT': ("value", np.float32, 1),
+    'INT': ("value", np.int32, 1),
+    'INT8': ("value", np.int32, 1),
+    'BOOLEAN': ("value", bool, 1),
+    'FLOAT2': ("vector", np.float32, 2),
+    'INT32_2D': ("value", np.int32, 2),
+    'FLOAT_VECTOR': ("vector", np.float32, 3),
+    'FLOAT_COLOR': ("color", np.float32, 4),
+    'BYTE_COLOR': ("color", np.float32, 4),
+    'QUATERNION': ("value", np.float32, 4),
+}
+# A background export whose modal operator has not ticked for this long is no longer running
+MODAL_TIMEOUT = 5.0
+# Last stderr lines of a worker kept for the error of its unfinished files
+WORKER_STDERR_LINES = 20
+
+# Switch and log name of the shared profiling block below
+PROFILING_PROPERTY = "multi_exporter_profiling"
+PROFILE_LOG_NAME = "multi_exporter_profile.json"
+
+# --- shared block "profiling": generated from shared/profiling.py by shared/sync.py, edit it there ---
+# Opt-in operator profiling, switched on by the WindowManager property named PROFILING_PROPERTY.
+# Runs are appended to the rolling log PROFILE_LOG_NAME in Blender's user config directory.
+MAX_PROFILE_ENTRIES = 500
+# Profile of the operator currently running; nested operators are folded into it
+_active_profile = None
+# Last profile per operator, shown in the Profiling subpanel
+_last_profiles = {}
+
+class OperatorProfile:
+    """Wall time per stage, bpy.ops calls and tracemalloc peak of one operator run."""
+
+    def __init__(self, operator):
+        self.operator = operator
+        self.started = time.time()
+        self.seconds = 0.0
+        self.stages = {}
+        self.ops_calls = None
+        self.peak_bytes = 0
+        self.result = None
+
+def get_profile_log_path():
+    return os.path.join(bpy.utils.user_resource('CONFIG'), PROFILE_LOG_NAME)
+
+@contextmanager
+def profile_stage(name):
+    # Stages with the same name add up, so a stage can be entered once per file or per rig
+    profile = _active_profile
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        if profile is not None:
+            profile.stages[name] = profile.stages.get(name, 0.0) + time.perf_counter() - start
+
+def count_ops_calls(profile):
+    # bpy.ops operators are called through this class; returns a function that undoes the patch
+    op_class = getattr(bpy.ops, "_BPyOpsSubModOp", None)
+    if op_class is None:
+        return lambda: None
+    original = op_class.__call__
+
+    def counted_call(self, *args, **kwargs):
+        profile.ops_calls += 1
+        return original(self, *args, **kwargs)
+
+    profile.ops_calls = 0
+    op_class.__call__ = counted_call
+
+    def restore():
+        op_class.__call__ = original
+    return restore
+
+def finish_profile(profile, result):
+    # Shows the profile in the subpanel and appends it to the log
+    profile.result = None if result is None else sorted(result)
+    _last_profiles[profile.operator] = profile
+    path = get_profile_log_path()
+    try:
+        with open(path) as f:
+            entries = json.load(f)
+    except (OSError, ValueError):
+        entries = []
+    entries.append(vars(profile))
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(entries[-MAX_PROFILE_ENTRIES:], f, indent=1)
+    except OSError as e:
+        print(f"Could not write operator profile log {path}: {e}")
+
+def profiled(execute):
+    """Decorator for Operator.execute; records a profile when profiling is switched on.
+
+    If execute returns RUNNING_MODAL the profile is left open as self._profile;
+    the modal part adds to it and hands it to finish_profile when it is done.
+    """
+    @functools.wraps(execute)
+    def wrapper(self, context):
+        global _active_profile
+        if _active_profile is not None or not getattr(context.window_manager, PROFILING_PROPERTY, False):
+            return execute(self, context)
+
+        profile = OperatorProfile(self.bl_idname)
+        _active_profile = profile
+        restore_ops = count_ops_calls(profile)
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        else:
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+        result = None
+        try:
+            result = execute(self, context)
+            return result
+        finally:
+            profile.seconds = time.perf_counter() - start
+            profile.peak_bytes = tracemalloc.get_traced_memory()[1]
+            if started_tracing:
+                tracemalloc.stop()
+            restore_ops()
+            _active_profile = None
+            if result is not None and 'RUNNING_MODAL' in result:
+                self._profile = profile
+            else:
+                finish_profile(profile, result)
+    return wrapper
+
+def draw_profiles(layout, context):
+    layout.prop(context.window_manager, PROFILING_PROPERTY)
+    for profile in _last_profiles.values():
+        box = layout.box()
+        ops_calls = "n/a" if profile.ops_calls is None else profile.ops_calls
+        box.label(text=f"{profile.operator}: {profile.seconds:.3f}s")
+        box.label(text=f"bpy.ops calls: {ops_calls}, peak: {profile.peak_bytes / 2**20:.1f} MiB")
+        col = box.column(align=True)
+        for name, seconds in profile.stages.items():
+            col.label(text=f"{name}: {seconds:.3f}s")
+    if _last_profiles:
+        layout.label(text=f"Log: {get_profile_log_path()}")
+
+def register_profiling():
+    setattr(bpy.types.WindowManager, PROFILING_PROPERTY, bpy.props.BoolProperty(
+        name="Profile Operators",
+        description="Record stage timings, bpy.ops calls and peak memory of this addon's operators",
+        default=False,
+    ))
+
+def unregister_profiling():
+    delattr(bpy.types.WindowManager, PROFILING_PROPERTY)
+# --- end of shared block "profiling" ---
+
+class ExportSelection:
+    """Selects only the objects of the current export and restores the user's selection afterwards."""
+
+    def __init__(self, context):
+        # The only scene-wide selection change happens here, once per export run
+        self.view_layer = context.view_layer
+        self.original_selected = list(context.selected_objects)
+        self.original_active = self.view_layer.objects.active
+        self.current = []
+        for ob in self.original_selected:
+            ob.select_set(False)
+
+    def select(self, objects):
+        for ob in self.current:
+            ob.select_set(False)
+        for ob in objects:
+            ob.select_set(True)
+        self.view_layer.objects.active = objects[0]
+        self.current = objects
+
+    def restore(self):
+        for ob in self.current:
+            ob.select_set(False)
+        for ob in self.original_selected:
+            ob.select_set(True)
+        self.view_layer.objects.active = self.original_active
+
+def export_objects(selection, object_names, export_format, file_path):
+    selection.select([bpy.data.objects[name] for name in object_names])
+
+    if export_format == 'FBX':
+        bpy.ops.export_scene.fbx(filepath=file_path, use_selection=True)
+    elif export_format == 'OBJ':
+        bpy.ops.wm.obj_export(filepath=file_path, export_selected_objects=True)
+    elif export_format == 'ALEMBIC':
+        bpy.ops.wm.alembic_export(filepath=file_path, selected=True)
+    elif export_format == 'STL':
+        bpy.ops.export_mesh.stl(filepath=file_path, use_selection=True)
+    elif export_format == 'COLLADA':
+        bpy.ops.wm.collada_export(filepath=file_path, selected=True)
+
+def get_export_jobs(multi_exporter):
+    # Group rows by format and target file; duplicate rows collapse into one job
+    export_path = bpy.path.abspath(multi_exporter.export_path)
+    blend_name = bpy.path.display_name_from_filepath(bpy.data.filepath) or "export"
+    jobs = {}
+    for obj in sorted(multi_exporter.objects, key=lambda o: o.file_format):
+        if multi_exporter.combine_by_format:
+            file_name = f"{blend_name}.{obj.file_format.lower()}"
+        else:
+            file_name = f"{obj.object_name}.{obj.file_format.lower()}"
+        file_path = os.path.join(export_path, file_name)
+        job = jobs.setdefault(file_path, {"object_names": [], "file_format": obj.file_format, "file_path": file_path})
+        if obj.object_name not in job["object_names"]:
+            job["object_names"].append(obj.object_name)
+    return list(jobs.values())
+
+def add_export_result(multi_exporter, job, status, seconds):
+    result = multi_exporter.results.add()
+    result.object_name = ", ".join(job["object_names"])
+    result.file_format = job["file_format"]
+    result.file_path = job["file_path"]
+    result.status = status
+    result.seconds = seconds
+
+def load_manifest(export_path):
+    try:
+        with open(os.path.join(export_path, MANIFEST_NAME)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_manifest(export_path, manifest):
+    with open(os.path.join(export_path, MANIFEST_NAME), "w") as f:
+        json.dump(manifest, f, indent=4)
+
+def read_array(collection, attr, dtype, width=1):
+    values = np.empty(len(collection) * width, dtype=dtype)
+    collection.foreach_get(attr, values)
+    return values
+
+def hash_mesh(digest, mesh):
+    # Everything the exporters write per element: positions, topology, smoothing, UVs, normals, attributes
+    digest.update(read_array(mesh.vertices, "co", np.float32, 3).tobytes())
+    digest.update(read_array(mesh.loops, "vertex_index", np.int32).tobytes())
+    digest.update(read_array(mesh.polygons, "use_smooth", bool).tobytes())
+    for layer in mesh.uv_layers:
+        digest.update(layer.name.encode())
+        digest.update(read_array(layer.data, "uv", np.float32, 2).tobytes())
+    if mesh.has_custom_normals:
+        if hasattr(mesh, "calc_normals_split"):
+            # Before Blender 4.1 corner normals are only filled in on request
+            mesh.calc_normals_split()
+        digest.update(read_array(mesh.loops, "normal", np.float32, 3).tobytes())
+    for attribute in mesh.attributes:
+        field = ATTRIBUTE_FIELDS.get(attribute.data_type)
+        if field is None or attribute.name.startswith("."):
+            # Names starting with a dot are internal, e.g. selection and hide state
+            continue
+        attr, dtype, width = field
+        digest.update(f"{attribute.name}:{attribute.domain}:{attribute.data_type}".encode())
+        digest.update(read_array(attribute.data, attr, dtype, width).tobytes())
+
+def hash_value(digest, value):
+    # Socket values are numbers, strings, IDs, or vectors and colours that repr would not expand
+    try:
+        if not isinstance(value, str):
+            value = tuple(value)
+    except TypeError:
+        pass
+    digest.update(repr(value).encode())
+
+def hash_node_tree(digest, node_tree, visited):
+    # Node types, input values, images and links, following node groups once each
+    if node_tree is None or node_tree.name in visited:
+        return
+    visited.add(node_tree.name)
+    digest.update(node_tree.name.encode())
+    for node in node_tree.nodes:
+        digest.update(f"{node.bl_idname}:{node.name}".encode())
+        for socket in node.inputs:
+            if hasattr(socket, "default_value"):
+                hash_value(digest, socket.default_value)
+        image = getattr(node, "image", None)
+        if image is not None:
+            # A texture edited on disk keeps its path, so the file's mtime is part of the hash
+            # Normalised, so a relative path remapped into a worker's snapshot hashes the same
+            path = os.path.normpath(bpy.path.abspath(image.filepath, library=image.library))
+            try:
+                mtime = os.path.getmtime(path)
+            except OSError:
+                mtime = None
+            digest.update(f"{image.name}:{image.source}:{path}:{mtime}".encode())
+        hash_node_tree(digest, getattr(node, "node_tree", None), visited)
+    for link in node_tree.links:
+        digest.update(f"{link.from_node.name}.{link.from_socket.identifier}>"
+                      f"{link.to_node.name}.{link.to_socket.identifier}".encode())
+
+def hash_material(material):
+    digest = hashlib.sha1()
+    digest.update(material.name.encode())
+    hash_value(digest, material.diffuse_color)
+    if material.use_nodes:
+        hash_node_tree(digest, material.node_tree, set())
+    return digest.hexdigest()
+
+def hash_export_job(job, depsgraph):
+    # Evaluated geometry, transform, materials and export settings of every object in the file
+    digest = hashlib.sha1()
+    digest.update(json.dumps([bl_info["version"], bpy.app.version_string, job["file_format"], job["file_path"]]).encode())
+    # Materials are usually shared, so each one is hashed once per job
+    material_hashes = {}
+    for name in job["object_names"]:
+        ob = bpy.data.objects[name]
+        digest.update(name.encode())
+        digest.update(np.array(ob.matrix_world, dtype=np.float32).tobytes())
+        for slot in ob.material_slots:
+            material = slot.material
+            if material is None:
+                digest.update(b"-")
+                continue
+            if material.name not in material_hashes:
+                material_hashes[material.name] = hash_material(material)
+            digest.update(material_hashes[material.name].encode())
+        if ob.type in GEOMETRY_TYPES:
+            ob_eval = ob.evaluated_get(depsgraph)
+            hash_mesh(digest, ob_eval.to_mesh())
+            ob_eval.to_mesh_clear()
+    return digest.hexdigest()
+
+def is_up_to_date(manifest, job):
+    entry = manifest.get(os.path.basename(job["file_path"]))
+    if entry is None or entry["hash"] != job["hash"]:
+        return False
+    try:
+        return os.path.getmtime(job["file_path"]) == entry["mtime"]
+    except OSError:
+        return False
+
+def record_export(manifest, job):
+    manifest[os.path.basename(job["file_path"])] = {"hash": job["hash"], "mtime": os.path.getmtime(job["file_path"])}
+
+def skip_unchanged_jobs(context, multi_exporter, jobs, manifest):
+    # Hash every job; unchanged ones are reported as skipped and not exported
+    depsgraph = context.evaluated_depsgraph_get()
+    changed_jobs = []
+    for job in jobs:
+        job["hash"] = hash_export_job(job, depsgraph)
+        if multi_exporter.skip_unchanged and is_up_to_date(manifest, job):
+            add_export_result(multi_exporter, job, "SKIPPED", 0.0)
+        else:
+            changed_jobs.append(job)
+    return changed_jobs
+
+def get_worker_script(temp_dir):
+    # Workers run this file; from the Text Editor __file__ names a text block instead,
+    # so a stub that runs the block from the snapshot is written. None if neither is found.
+    if os.path.isfile(__file__):
+        return __file__
+    text = bpy.data.texts.get(os.path.basename(__file__))
+    if text is None:
+        return None
+    script_path = os.path.join(temp_dir, "worker.py")
+    with open(script_path, "w") as f:
+        f.write(WORKER_STUB.format(name=text.name))
+    return script_path
+
+def run_export_worker(jobs_path):
+    # Entry point inside a background 'blender -b' process; jobs are hashed here,
+    # so the open file never waits for it, and unchanged files are reported as skipped
+    with open(jobs_path) as f:
+        work = json.load(f)
+    selection = ExportSelection(bpy.context)
+    for job in work["jobs"]:
+        start = time.perf_counter()
+        try:
+            job["hash"] = hash_export_job(job, bpy.context.evaluated_depsgraph_get())
+            if work["skip_unchanged"] and is_up_to_date(work["manifest"], job):
+                status = "SKIPPED"
+            else:
+                export_objects(selection, job["object_names"], job["file_format"], job["file_path"])
+                status = "OK"
+        except Exception as e:
+            status = f"ERROR: {e}"
+        result = dict(job, status=status, seconds=time.perf_counter() - start)
+        print(RESULT_PREFIX + json.dumps(result), flush=True)
+
+def read_worker_output(process, results):
+    for line in process.stdout:
+        if line.startswith(RESULT_PREFIX):
+            results.put(json.loads(line[len(RESULT_PREFIX):]))
+
+def read_worker_errors(process, lines):
+    # stderr is drained on its own thread so a chatty worker never blocks on a full pipe
+    for line in process.stderr:
+        if line.strip():
+            lines.append(line.rstrip())
+
+def get_worker_error(process, stderr_lines):
+    # One-line summary for the report; the full stderr tail goes to the console
+    error = f"ERROR: worker exited with code {process.returncode}"
+    if stderr_lines:
+        print(f"MultiExporter worker {process.pid} stderr:\n" + "\n".join(stderr_lines))
+        error += ": " + stderr_lines[-1]
+    return error
+
+class BackgroundExport:
+    """State of the running background export.
+
+    Kept in the module rather than on the scene so it is never saved into a
+    .blend file; a file loaded mid-export cannot come back with an export
+    that no operator is running.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.running = False
+        self.cancel_requested = False
+        self.done = 0
+        self.total = 0
+        self.processes = []
+        self.last_tick = 0.0
+
+    def is_alive(self):
+        # The modal operator ticks on every timer event; it is gone if the ticks stopped
+        return self.running and time.monotonic() - self.last_tick < MODAL_TIMEOUT
+
+_background_export = BackgroundExport()
 
 class ExportObjectProperties(bpy.types.PropertyGroup):
     object_name: bpy.props.StringProperty(name="Object Name")
@@ -25,6 +473,13 @@ class ExportObjectProperties(bpy.types.PropertyGroup):
         ]
     )
 
+class ExportResultProperties(bpy.types.PropertyGroup):
+    object_name: bpy.props.StringProperty(name="Object Name")
+    file_format: bpy.props.StringProperty(name="File Format")
+    file_path: bpy.props.StringProperty(name="File Path")
+    status: bpy.props.StringProperty(name="Status")
+    seconds: bpy.props.FloatProperty(name="Seconds")
+
 class MultiExporterProperties(bpy.types.PropertyGroup):
     export_path: bpy.props.StringProperty(
         name="Export Path",
@@ -34,22 +489,46 @@ class MultiExporterProperties(bpy.types.PropertyGroup):
         subtype='DIR_PATH'
     )
     objects: bpy.props.CollectionProperty(type=ExportObjectProperties)
+    skip_unchanged: bpy.props.BoolProperty(
+        name="Skip Unchanged",
+        description="Skip files whose objects, materials and settings match the last export",
+        default=True,
+    )
+    combine_by_format: bpy.props.BoolProperty(
+        name="One File per Format",
+        description="Export all rows of the same format into a single multi-object file",
+        default=False,
+    )
+    use_workers: bpy.props.BoolProperty(
+        name="Background Workers",
+        description="Export from a snapshot of the file in parallel background Blender processes",
+        default=False,
+    )
+    worker_count: bpy.props.IntProperty(
+        name="Workers",
+        description="Number of background Blender processes",
+        default=max(1, (os.cpu_count() or 2) // 2),
+        min=1,
+    )
+    results: bpy.props.CollectionProperty(type=ExportResultProperties)
 
 class OBJECT_OT_SelectObjects(bpy.types.Operator):
     bl_idname = "object.select_objects_to_export"
     bl_label = "Select Objects to Export"
     bl_description = "Select objects to export and create export info rows"
 
+    @profiled
     def execute(self, context):
         scene = context.scene
         multi_exporter = scene.multi_exporter
 
-        multi_exporter.objects.clear()
+        with profile_stage("rows"):
+            multi_exporter.objects.clear()
 
-        for obj in bpy.context.selected_objects:
-            item = multi_exporter.objects.add()
-            item.object_name = obj.name
-            item.file_format = 'FBX'  # Default value
+            for obj in bpy.context.selected_objects:
+                item = multi_exporter.objects.add()
+                item.object_name = obj.name
+                item.file_format = 'FBX'  # Default value
 
         return {'FINISHED'}
 
@@ -58,32 +537,186 @@ class OBJECT_OT_ExportObjects(bpy.types.Operator):
     bl_label = "Export"
     bl_description = "Export the selected objects to the specified formats"
 
+    @profiled
     def execute(self, context):
         scene = context.scene
         multi_exporter = scene.multi_exporter
 
-        for obj in multi_exporter.objects:
-            object_name = obj.object_name
-            export_format = obj.file_format
-            export_path = bpy.path.abspath(multi_exporter.export_path)
-            file_path = os.path.join(export_path, f"{object_name}.{export_format.lower()}")
-
-            bpy.ops.object.select_all(action='DESELECT')
-            bpy.data.objects[object_name].select_set(True)
-            bpy.context.view_layer.objects.active = bpy.data.objects[object_name]
-
-            if export_format == 'FBX':
-                bpy.ops.export_scene.fbx(filepath=file_path, use_selection=True)
-            elif export_format == 'OBJ':
-                bpy.ops.wm.obj_export(filepath=file_path, export_selected_objects=True)
-            elif export_format == 'ALEMBIC':
-                bpy.ops.wm.alembic_export(filepath=file_path, selected=True)
-            elif export_format == 'STL':
-                bpy.ops.export_mesh.stl(filepath=file_path, use_selection=True)
-            elif export_format == 'COLLADA':
-                bpy.ops.wm.collada_export(filepath=file_path, selected=True)
-
-        self.report({'INFO'}, "Objects exported successfully")
+        multi_exporter.results.clear()
+        with profile_stage("jobs"):
+            jobs = get_export_jobs(multi_exporter)
+        if not jobs:
+            return {'CANCELLED'}
+
+        export_path = bpy.path.abspath(multi_exporter.export_path)
+        with profile_stage("skip unchanged"):
+            manifest = load_manifest(export_path)
+            jobs = skip_unchanged_jobs(context, multi_exporter, jobs, manifest)
+
+        selection = ExportSelection(context)
+        try:
+            for job in jobs:
+                start = time.perf_counter()
+                with profile_stage("export " + os.path.basename(job["file_path"])):
+                    export_objects(selection, job["object_names"], job["file_format"], job["file_path"])
+                add_export_result(multi_exporter, job, "OK", time.perf_counter() - start)
+                record_export(manifest, job)
+        finally:
+            with profile_stage("cleanup"):
+                selection.restore()
+                save_manifest(export_path, manifest)
+
+        self.report({'INFO'}, f"Exported {len(jobs)} file(s), {len(multi_exporter.results) - len(jobs)} unchanged")
+        return {'FINISHED'}
+
+class OBJECT_OT_ExportObjectsParallel(bpy.types.Operator):
+    bl_idname = "object.export_objects_parallel"
+    bl_label = "Export in Background"
+    bl_description = "Export the rows from a snapshot of this file using background Blender workers"
+
+    @profiled
+    def execute(self, context):
+        # Set by @profiled once execute returns, if profiling is on
+        self._profile = None
+        multi_exporter = context.scene.multi_exporter
+        if _background_export.is_alive():
+            self.report({'WARNING'}, "An export is already running")
+            return {'CANCELLED'}
+
+        multi_exporter.results.clear()
+        with profile_stage("jobs"):
+            jobs = get_export_jobs(multi_exporter)
+        if not jobs:
+            return {'CANCELLED'}
+
+        self._export_path = bpy.path.abspath(multi_exporter.export_path)
+        self._manifest = load_manifest(self._export_path)
+
+        # Workers read a saved copy, so the open file is left untouched
+        with profile_stage("snapshot"):
+            self._temp_dir = tempfile.mkdtemp(prefix="multi_exporter_")
+            worker_script = get_worker_script(self._temp_dir)
+            if worker_script is None:
+                shutil.rmtree(self._temp_dir, ignore_errors=True)
+                self.report({'ERROR'}, f"Cannot start workers: {__file__} is neither a file nor a text block; "
+                                       "install the addon or export without Background Workers")
+                return {'CANCELLED'}
+            snapshot_path = os.path.join(self._temp_dir, "snapshot.blend")
+            bpy.ops.wm.save_as_mainfile(filepath=snapshot_path, copy=True, check_existing=False)
+
+        worker_count = min(multi_exporter.worker_count, len(jobs))
+        self._results = queue.Queue()
+        self._workers = []
+        self._readers = []
+        self._reported = set()
+        with profile_stage("start workers"):
+            # Round-robin the rows over the workers
+            for i in range(worker_count):
+                worker_jobs = jobs[i::worker_count]
+                jobs_path = os.path.join(self._temp_dir, f"jobs_{i}.json")
+                with open(jobs_path, "w") as f:
+                    json.dump({"jobs": worker_jobs, "skip_unchanged": multi_exporter.skip_unchanged,
+                               "manifest": self._manifest}, f)
+                command = [bpy.app.binary_path, "-b", snapshot_path, "--python", worker_script,
+                           "--", WORKER_FLAG, jobs_path]
+                process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+                stderr_lines = collections.deque(maxlen=WORKER_STDERR_LINES)
+                for target, args in ((read_worker_output, (process, self._results)),
+                                     (read_worker_errors, (process, stderr_lines))):
+                    reader = threading.Thread(target=target, args=args, daemon=True)
+                    reader.start()
+                    self._readers.append(reader)
+                self._workers.append((process, worker_jobs, stderr_lines))
+
+        _background_export.reset()
+        _background_export.running = True
+        _background_export.total = len(jobs)
+        _background_export.processes = [process for process, worker_jobs, stderr_lines in self._workers]
+        _background_export.last_tick = time.monotonic()
+
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(0.25, window=context.window)
+        wm.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+
+        _background_export.last_tick = time.monotonic()
+        multi_exporter = context.scene.multi_exporter
+        while not self._results.empty():
+            job = self._results.get()
+            add_export_result(multi_exporter, job, job["status"], job["seconds"])
+            if job["status"] == "OK":
+                record_export(self._manifest, job)
+            self._reported.add(job["file_path"])
+            _background_export.done += 1
+            if self._profile is not None:
+                # Worker timings stand in for the per-file export stages of the foreground export
+                self._profile.stages["export " + os.path.basename(job["file_path"])] = job["seconds"]
+
+        for area in context.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
+
+        if _background_export.cancel_requested:
+            for process, worker_jobs, stderr_lines in self._workers:
+                process.terminate()
+            done = _background_export.done
+            self.finish(context, {'CANCELLED'})
+            self.report({'WARNING'}, f"Export cancelled after {done} file(s)")
+            return {'CANCELLED'}
+
+        # Readers stop once their worker exits and its output is drained
+        if not any(reader.is_alive() for reader in self._readers) and self._results.empty():
+            self.finish(context, {'FINISHED'})
+            self.add_missing_results(multi_exporter)
+            exported = len([r for r in multi_exporter.results if r.status == "OK"])
+            unchanged = len([r for r in multi_exporter.results if r.status == "SKIPPED"])
+            failed = len([r for r in multi_exporter.results if r.status.startswith("ERROR")])
+            self.report({'INFO'}, f"Exported {exported} file(s), {unchanged} unchanged, {failed} failed")
+            return {'FINISHED'}
+
+        return {'PASS_THROUGH'}
+
+    def add_missing_results(self, multi_exporter):
+        # A worker that crashed or was killed never printed results for its remaining files
+        for process, worker_jobs, stderr_lines in self._workers:
+            missing = [job for job in worker_jobs if job["file_path"] not in self._reported]
+            if missing:
+                error = get_worker_error(process, list(stderr_lines))
+                for job in missing:
+                    add_export_result(multi_exporter, job, error, 0.0)
+
+    def finish(self, context, result):
+        context.window_manager.event_timer_remove(self._timer)
+        for process, worker_jobs, stderr_lines in self._workers:
+            process.wait()
+        shutil.rmtree(self._temp_dir, ignore_errors=True)
+        save_manifest(self._export_path, self._manifest)
+        _background_export.reset()
+        if self._profile is not None:
+            # The profile runs from execute until the last worker is done; peak and bpy.ops calls cover execute
+            self._profile.seconds = time.time() - self._profile.started
+            finish_profile(self._profile, result)
+
+class OBJECT_OT_CancelExport(bpy.types.Operator):
+    bl_idname = "object.cancel_export"
+    bl_label = "Cancel Export"
+    bl_description = "Stop the running background export"
+
+    @profiled
+    def execute(self, context):
+        if _background_export.is_alive():
+            _background_export.cancel_requested = True
+            return {'FINISHED'}
+        # No modal operator is left to act on the request, e.g. it was dropped with a file load
+        for process in _background_export.processes:
+            if process.poll() is None:
+                process.terminate()
+        _background_export.reset()
+        self.report({'INFO'}, "Cleared a background export that was no longer running")
         return {'FINISHED'}
 
 class OBJECT_PT_MultiExporterPanel(bpy.types.Panel):
@@ -110,23 +743,71 @@ class OBJECT_PT_MultiExporterPanel(bpy.types.Panel):
                 row.prop(obj, "file_format", text="File Format", expand=True)
 
             layout.prop(multi_exporter, "export_path")
-            layout.operator("object.export_objects", text="Export")
+            layout.prop(multi_exporter, "combine_by_format")
+            layout.prop(multi_exporter, "skip_unchanged")
+            row = layout.row(align=True)
+            row.prop(multi_exporter, "use_workers")
+            sub = row.row(align=True)
+            sub.enabled = multi_exporter.use_workers
+            sub.prop(multi_exporter, "worker_count")
+
+            if _background_export.running:
+                row = layout.row(align=True)
+                row.label(text=f"Exported {_background_export.done}/{_background_export.total}")
+                row.operator("object.cancel_export", text="Cancel")
+            elif multi_exporter.use_workers:
+                layout.operator("object.export_objects_parallel", text="Export")
+            else:
+                layout.operator("object.export_objects", text="Export")
+
+        if multi_exporter.results:
+            box = layout.box()
+            total = sum(r.seconds for r in multi_exporter.results)
+            box.label(text=f"Export Report ({len(multi_exporter.results)} files, {total:.2f}s)")
+            for result in multi_exporter.results:
+                icon = 'ERROR' if result.status.startswith("ERROR") else 'CHECKMARK'
+                box.label(text=f"{os.path.basename(result.file_path)}: {result.status} ({result.seconds:.2f}s)", icon=icon)
+
+class OBJECT_PT_MultiExporterProfiling(bpy.types.Panel):
+    bl_label = "Profiling"
+    bl_idname = "OBJECT_PT_MultiExporterProfiling"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = 'MultiExporter'
+    bl_parent_id = "OBJECT_PT_MultiExporterPanel"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        draw_profiles(self.layout, context)
 
 def register():
     bpy.utils.register_class(ExportObjectProperties)
+    bpy.utils.register_class(ExportResultProperties)
     bpy.utils.register_class(MultiExporterProperties)
     bpy.utils.register_class(OBJECT_OT_SelectObjects)
     bpy.utils.register_class(OBJECT_OT_ExportObjects)
+    bpy.utils.register_class(OBJECT_OT_ExportObjectsParallel)
+    bpy.utils.register_class(OBJECT_OT_CancelExport)
     bpy.utils.register_class(OBJECT_PT_MultiExporterPanel)
+    bpy.utils.register_class(OBJECT_PT_MultiExporterProfiling)
     bpy.types.Scene.multi_exporter = bpy.props.PointerProperty(type=MultiExporterProperties)
+    register_profiling()
 
 def unregister():
     bpy.utils.unregister_class(ExportObjectProperties)
+    bpy.utils.unregister_class(ExportResultProperties)
     bpy.utils.unregister_class(MultiExporterProperties)
     bpy.utils.unregister_class(OBJECT_OT_SelectObjects)
     bpy.utils.unregister_class(OBJECT_OT_ExportObjects)
+    bpy.utils.unregister_class(OBJECT_OT_ExportObjectsParallel)
+    bpy.utils.unregister_class(OBJECT_OT_CancelExport)
+    bpy.utils.unregister_class(OBJECT_PT_MultiExporterProfiling)
     bpy.utils.unregister_class(OBJECT_PT_MultiExporterPanel)
     del bpy.types.Scene.multi_exporter
+    unregister_profiling()
 
 if __name__ == "__main__":
-    register()
+    if WORKER_FLAG in sys.argv:
+        run_export_worker(sys.argv[sys.argv.index(WORKER_FLAG) + 1])
+    else:
+        register()
@@ -1,48 +1,354 @@
 import bpy
 import mathutils
+import numpy as np
+from bpy.app.handlers import persistent
 
-def get_world_mesh_verts(ob):         
-    if ob.type == 'MESH':
-        world_matrix = ob.matrix_world
-        return [world_matrix @ vertex.co for vertex in ob.data.vertices]
-    else:
-        return []
-    
+# A text block starts from scratch on every run; caches and the hierarchy index are kept here so they outlive a run
+_session = bpy.app.driver_namespace.setdefault("Q6_CentreOfMeshes", {})
+# Per-mesh local vertex count and sum, keyed by mesh datablock identity and checked against its geometry version
+_local_stats = _session.setdefault("local_stats", {})
+_geometry_versions = _session.setdefault("geometry_versions", {})
+
+# --- shared block "mesh_verts": generated from shared/mesh_verts.py by shared/sync.py, edit it there ---
+def get_local_mesh_verts(mesh):
+    # Read all vertex coordinates in one call
+    vertices = mesh.vertices
+    co = np.empty(len(vertices) * 3, dtype=np.float32)
+    vertices.foreach_get("co", co)
+    return co.reshape(-1, 3)
+# --- end of shared block "mesh_verts" ---
+
+# --- shared block "hierarchy_index": generated from shared/hierarchy_index.py by shared/sync.py, edit it there ---
+class HierarchyIndex:
+    """Parent and children of every object in bpy.data, kept current from depsgraph updates.
+
+    The attributes are stored in state, so a text block can pass a dict kept
+    in bpy.app.driver_namespace and keep the index across runs.
+    """
+
+    def __init__(self, state=None):
+        self.__dict__ = {} if state is None else state
+        if "parent" not in self.__dict__:
+            self.parent = {}
+            self.children = {}
+            self.dirty = True
+
+    def rebuild(self):
+        self.parent = {}
+        self.children = {}
+        for ob in bpy.data.objects:
+            self._add(ob)
+        self.dirty = False
+
+    def _add(self, ob):
+        self.parent[ob] = ob.parent
+        if ob.parent is not None:
+            self.children.setdefault(ob.parent, []).append(ob)
+
+    def _remove(self, ob):
+        parent = self.parent.pop(ob)
+        if parent is not None:
+            siblings = self.children[parent]
+            siblings.remove(ob)
+            if not siblings:
+                del self.children[parent]
+
+    def update_object(self, ob):
+        if ob in self.parent:
+            if self.parent[ob] == ob.parent:
+                return
+            self._remove(ob)
+        self._add(ob)
+
+    def update(self, depsgraph):
+        # Added and re-parented objects are reported; removed ones are not
+        if self.dirty:
+            return
+        for update in depsgraph.updates:
+            if isinstance(update.id, bpy.types.Object):
+                self.update_object(update.id.original)
+
+    def ensure(self, tracked=True):
+        # Untracked means no handler keeps the index current, so it is rebuilt for every query.
+        # A changed object count catches removals; _get_valid_children catches those the count hides.
+        if self.dirty or not tracked or len(self.parent) != len(bpy.data.objects):
+            self.rebuild()
+        return self
 
-def get_all_world_mesh_verts(parent_ob):
-    verts = []
+    def _get_valid_children(self, ob):
+        # A removal paired with an unseen addition keeps the count; the removed child then raises
+        # ReferenceError, or its reused pointer reports another parent
+        children = self.children.get(ob, ())
+        try:
+            valid = all(child.parent == ob for child in children)
+        except ReferenceError:
+            valid = False
+        if not valid:
+            self.rebuild()
+            children = self.children.get(ob, ())
+        return children
+
+    def get_children(self, ob):
+        # Name order, the same after any edit history; the lists themselves follow update order
+        return sorted(self._get_valid_children(ob), key=lambda child: child.name)
+
+    def descendants(self, ob):
+        # Depth-first, same set of objects as ob.children_recursive
+        result = []
+        stack = list(reversed(self._get_valid_children(ob)))
+        while stack:
+            child = stack.pop()
+            result.append(child)
+            stack.extend(reversed(self._get_valid_children(child)))
+        return result
+# --- end of shared block "hierarchy_index" ---
+
+_hierarchy_index = HierarchyIndex(_session.setdefault("hierarchy_index", {}))
+
+def get_hierarchy_index():
+    # Without the handler nothing keeps the index current
+    return _hierarchy_index.ensure(q6_on_depsgraph_update in bpy.app.handlers.depsgraph_update_post)
+
+# --- shared block "mesh_objects": generated from shared/mesh_objects.py by shared/sync.py, edit it there ---
+def get_mesh_objects(parent_ob, descendants):
+    # parent_ob and its descendants that are meshes
     if parent_ob.type == 'MESH':
-        verts.extend(get_world_mesh_verts(parent_ob))
-    for child in parent_ob.children_recursive:
+        yield parent_ob
+    for child in descendants:
         if child.type == 'MESH':
-            verts.extend(get_world_mesh_verts(child))                            
-    return verts
+            yield child
+# --- end of shared block "mesh_objects" ---
+
+# --- shared block "transforms": generated from shared/transforms.py by shared/sync.py, edit it there ---
+# Floats per object of every transform attribute read_transforms can bulk-read
+TRANSFORM_SIZES = {"matrix_world": 16, "location": 3, "rotation_euler": 3, "scale": 3}
+# Up to this many objects, reading them one by one is cheaper than a pass over bpy.data.objects
+PER_OBJECT_LIMIT = 256
+
+class TransformSnapshot:
+    """Transforms of every object in bpy.data, read with one foreach_get per attribute on first use."""
+
+    def __init__(self):
+        self.objects = bpy.data.objects
+        self.rows = {ob: i for i, ob in enumerate(self.objects)}
+        self.arrays = {}
+
+    def read(self, attr):
+        array = self.arrays.get(attr)
+        if array is None:
+            flat = np.empty(len(self.objects) * TRANSFORM_SIZES[attr], dtype=np.float32)
+            self.objects.foreach_get(attr, flat)
+            if attr == "matrix_world":
+                # RNA stores matrices column by column
+                array = flat.reshape(-1, 4, 4).transpose(0, 2, 1)
+            else:
+                array = flat.reshape(-1, 3)
+            self.arrays[attr] = array
+        return array
+
+def read_transforms(objects, attributes, snapshot=None):
+    """Transforms of objects as float32 arrays keyed by attribute; row i belongs to objects[i].
 
+    matrix_world is (n, 4, 4) in row-major (mathutils) order, the others are
+    (n, 3). Pass a TransformSnapshot to share one read of the file between calls.
+    """
+    objects = list(objects)
+    if snapshot is None and len(objects) <= PER_OBJECT_LIMIT:
+        arrays = {}
+        for attr in attributes:
+            shape = (len(objects), 4, 4) if attr == "matrix_world" else (len(objects), 3)
+            array = np.empty(shape, dtype=np.float32)
+            for i, ob in enumerate(objects):
+                array[i] = getattr(ob, attr)
+            arrays[attr] = array
+        return arrays
 
+    if snapshot is None:
+        snapshot = TransformSnapshot()
+    rows = np.fromiter((snapshot.rows[ob] for ob in objects), dtype=np.intp, count=len(objects))
+    return {attr: snapshot.read(attr)[rows] for attr in attributes}
+# --- end of shared block "transforms" ---
+
+class LocalMeshStats:
+    """Local-space vertex count and sum of one mesh datablock."""
+
+    def __init__(self, count, vertex_sum):
+        self.count = count
+        self.sum = vertex_sum
+        self.version = None
+
+def get_mesh_key(mesh):
+    pointer = mesh.as_pointer()
+    # The vertex count guards against edits made while the handlers are not registered
+    return pointer, (_geometry_versions.get(pointer, 0), len(mesh.vertices))
+
+def get_local_mesh_stats(mesh):
+    pointer, version = get_mesh_key(mesh)
+    stats = _local_stats.get(pointer)
+    if stats is None or stats.version != version:
+        co = get_local_mesh_verts(mesh)
+        stats = LocalMeshStats(len(co), co.sum(axis=0, dtype=np.float64))
+        stats.version = version
+        _local_stats[pointer] = stats
+    return stats
+
+def get_world_mesh_sums(mesh_objects, matrices):
+    """Vertex counts (n,) and world-space vertex sums (3, n) of mesh objects.
+
+    The sum is affine in the transform, so it follows from the cached local
+    sum without reading any vertices; rotation does not matter for a centroid.
+    """
+    local = [get_local_mesh_stats(ob.data) for ob in mesh_objects]
+    counts = np.fromiter((stats.count for stats in local), dtype=np.int64, count=len(local))
+    sums = np.array([stats.sum for stats in local], dtype=np.float64).reshape(-1, 3)
+    matrices = np.asarray(matrices, dtype=np.float64).reshape(-1, 4, 4)
+    world_sums = np.einsum("nij,nj->in", matrices[:, :3, :3], sums) + counts * matrices[:, :3, 3].T
+    # Rows of coordinates are contiguous, so sums over meshes are pairwise and stay accurate for large scenes
+    return counts, np.ascontiguousarray(world_sums)
+
+def clear_mesh_cache():
+    _local_stats.clear()
+    _geometry_versions.clear()
+
+def check_mesh_cache():
+    # Without the depsgraph handler mesh edits go unnoticed, so nothing cached can be trusted
+    handler_names = {getattr(h, "__name__", None) for h in bpy.app.handlers.depsgraph_update_post}
+    if q6_on_depsgraph_update.__name__ not in handler_names:
+        clear_mesh_cache()
 
 def calc_center_of_meshes(obj):
-    verts = get_all_world_mesh_verts(obj)    
-    if not verts:
+    check_mesh_cache()
+    mesh_objects = list(get_mesh_objects(obj, get_hierarchy_index().descendants(obj)))
+    matrices = read_transforms(mesh_objects, ("matrix_world",))["matrix_world"]
+    counts, world_sums = get_world_mesh_sums(mesh_objects, matrices)
+    count = counts.sum()
+    if count == 0:
         return None
-    
-    center = mathutils.Vector((0, 0, 0))
-    
-    for vert in verts:
-        center += vert
-    
-    center /= len(verts)
+
+    center = mathutils.Vector(world_sums.sum(axis=1) / count)
     return center
 
+def calc_centers_of_meshes(roots):
+    """Centroid of the meshes under every root as an (n, 3) array, NaN where a root has none.
+
+    Roots may overlap; every mesh object is reduced once however many
+    subtrees contain it, and shared mesh data once through the mesh cache.
+    """
+    check_mesh_cache()
+    index = get_hierarchy_index()
+    subtrees = [list(get_mesh_objects(root, index.descendants(root))) for root in roots]
+    mesh_objects = list(dict.fromkeys(ob for subtree in subtrees for ob in subtree))
+    matrices = read_transforms(mesh_objects, ("matrix_world",))["matrix_world"]
+    counts, world_sums = get_world_mesh_sums(mesh_objects, matrices)
+    rows = {ob: i for i, ob in enumerate(mesh_objects)}
+
+    centers = np.full((len(roots), 3), np.nan)
+    for i, subtree in enumerate(subtrees):
+        indices = np.fromiter((rows[ob] for ob in subtree), dtype=np.intp, count=len(subtree))
+        count = counts[indices].sum()
+        if count:
+            centers[i] = world_sums[:, indices].sum(axis=1) / count
+    return centers
+
+def mark_centers(roots, collection):
+    # Marker empties are created from data and linked in one go; returns them and the centers
+    centers = calc_centers_of_meshes(roots)
+    markers = []
+    for root, center in zip(roots, centers):
+        if np.isnan(center).any():
+            continue
+        marker = bpy.data.objects.new(root.name + "_Center", None)
+        marker.location = center
+        markers.append(marker)
+    for marker in markers:
+        collection.objects.link(marker)
+    return markers, centers
+
+class OBJECT_OT_MarkHierarchyCenters(bpy.types.Operator):
+    bl_idname = "object.mark_hierarchy_centers"
+    bl_label = "Mark Hierarchy Centers"
+    bl_description = "Add an empty at the centroid of the meshes under every selected object"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        roots = list(context.selected_objects)
+        if not roots and context.object:
+            roots = [context.object]
+        if not roots:
+            self.report({'WARNING'}, "No object selected")
+            return {'CANCELLED'}
+
+        markers, centers = mark_centers(roots, context.collection)
+        if not markers:
+            self.report({'WARNING'}, "No mesh found in the selected hierarchies")
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"Marked {len(markers)} of {len(roots)} hierarchy center(s)")
+        return {'FINISHED'}
+
+@persistent
+def q6_on_depsgraph_update(scene, depsgraph):
+    _hierarchy_index.update(depsgraph)
+    for update in depsgraph.updates:
+        if not update.is_updated_geometry:
+            continue
+        data = update.id.original
+        if isinstance(data, bpy.types.Object):
+            data = data.data
+        if isinstance(data, bpy.types.Mesh):
+            pointer = data.as_pointer()
+            _geometry_versions[pointer] = _geometry_versions.get(pointer, 0) + 1
+            _local_stats.pop(pointer, None)
+
+@persistent
+def q6_on_data_reloaded(*args):
+    # Undo, redo and file loads replace every object, so the stored references are stale
+    _hierarchy_index.dirty = True
+
+@persistent
+def q6_on_load_post(*args):
+    # Datablock pointers are not valid across files
+    clear_mesh_cache()
+
+# --- shared block "set_handler": generated from shared/set_handler.py by shared/sync.py, edit it there ---
+def set_handler(handler_list, handler):
+    # Every run of a text block defines new functions; drop the ones left by earlier runs
+    for old in [h for h in handler_list if getattr(h, "__name__", None) == handler.__name__]:
+        handler_list.remove(old)
+    handler_list.append(handler)
+# --- end of shared block "set_handler" ---
+
+def register():
+    bpy.utils.register_class(OBJECT_OT_MarkHierarchyCenters)
+    # Keep cached mesh stats and the hierarchy index valid across runs
+    handlers = bpy.app.handlers
+    set_handler(handlers.depsgraph_update_post, q6_on_depsgraph_update)
+    for handler_list in (handlers.load_post, handlers.undo_post, handlers.redo_post):
+        set_handler(handler_list, q6_on_data_reloaded)
+    set_handler(handlers.load_post, q6_on_load_post)
+
+def unregister():
+    bpy.utils.unregister_class(OBJECT_OT_MarkHierarchyCenters)
+    handlers = bpy.app.handlers
+    for handler_list in (handlers.depsgraph_update_post, handlers.load_post, handlers.undo_post, handlers.redo_post):
+        for old in [h for h in handler_list if getattr(h, "__name__", "").startswith("q6_on_")]:
+            handler_list.remove(old)
+    _hierarchy_index.dirty = True
+    clear_mesh_cache()
 
 
-parent_obj = bpy.context.object
+if __name__ == "__main__":
+    register()
+    roots = list(bpy.context.selected_objects)
+    if not roots and bpy.context.object:
+        roots = [bpy.context.object]
 
-if parent_obj:
-    center = calc_center_of_meshes(parent_obj)
-    bpy.ops.object.empty_add(type='PLAIN_AXES', align='WORLD', location=center, scale=(1, 1, 1))
-    if center:
-        print(f"Center of meshes: {center}")
+    if roots:
+        # Markers are only created for hierarchies that contain meshes
+        markers, centers = mark_centers(roots, bpy.context.collection)
+        for root, center in zip(roots, centers):
+            if np.isnan(center).any():
+                print(f"{root.name}: No mesh found in the hierarchy.")
+            else:
+                print(f"{root.name}: Center of meshes: {mathutils.Vector(center)}")
     else:
-        print("No mesh children found.")
-else:
-    print("No object selected.")
+        print("No object selected.")
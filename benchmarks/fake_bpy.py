@@ -0,0 +1,298 @@
+"""Minimal stand-ins for bpy and mathutils so the hot paths can be timed on plain CPython.
+
+Only what the benchmarked functions touch is modelled: datablock collections,
+object parenting and transforms, and vertex collections with foreach_get and
+foreach_set backed by NumPy arrays. install() registers the modules in
+sys.modules and must run before anything imports bpy.
+"""
+import sys
+import types
+
+import numpy as np
+
+
+class Vector(list):
+    """List-backed vector with the few mathutils.Vector methods the scripts use."""
+
+    def copy(self):
+        return Vector(self)
+
+    @property
+    def x(self):
+        return self[0]
+
+    @property
+    def y(self):
+        return self[1]
+
+    @property
+    def z(self):
+        return self[2]
+
+
+class Matrix(list):
+    pass
+
+
+class Euler(Vector):
+    pass
+
+
+class ID:
+    def __init__(self, name):
+        self.name = name
+        self.users = 0
+        self._props = {}
+
+    def as_pointer(self):
+        return id(self)
+
+    @property
+    def original(self):
+        return self
+
+    def get(self, key, default=None):
+        return self._props.get(key, default)
+
+    def __getitem__(self, key):
+        return self._props[key]
+
+    def __setitem__(self, key, value):
+        self._props[key] = value
+
+
+class VertexCollection:
+    def __init__(self, co):
+        self.co = np.ascontiguousarray(co, dtype=np.float32).reshape(-1, 3)
+
+    def __len__(self):
+        return len(self.co)
+
+    def add(self, count):
+        self.co = np.concatenate([self.co, np.zeros((count, 3), dtype=np.float32)])
+
+    def foreach_get(self, attr, out):
+        out[:] = getattr(self, attr).ravel()
+
+    def foreach_set(self, attr, values):
+        getattr(self, attr).ravel()[:] = values
+
+
+class Mesh(ID):
+    def __init__(self, name, co=()):
+        super().__init__(name)
+        self.vertices = VertexCollection(np.asarray(co, dtype=np.float32))
+        self.materials = []
+
+    def from_pydata(self, vertices, edges, faces):
+        self.vertices = VertexCollection(np.asarray(vertices, dtype=np.float32))
+
+    def update(self):
+        pass
+
+    def copy(self):
+        mesh = Mesh(self.name)
+        mesh.vertices = VertexCollection(self.vertices.co.copy())
+        mesh.materials = list(self.materials)
+        return mesh
+
+
+class Object(ID):
+    def __init__(self, name, object_data=None):
+        super().__init__(name)
+        self.data = object_data
+        if object_data is not None:
+            object_data.users += 1
+        self.type = 'MESH' if isinstance(object_data, Mesh) else 'EMPTY'
+        self._parent = None
+        self._children = []
+        self.location = Vector((0.0, 0.0, 0.0))
+        self.rotation_euler = Euler((0.0, 0.0, 0.0))
+        self.scale = Vector((1.0, 1.0, 1.0))
+        self.matrix_world = np.identity(4)
+        self.modifiers = []
+        self.material_slots = []
+
+    @property
+    def parent(self):
+        return self._parent
+
+    @parent.setter
+    def parent(self, parent):
+        if self._parent is not None:
+            self._parent._children.remove(self)
+        self._parent = parent
+        if parent is not None:
+            parent._children.append(self)
+
+    @property
+    def children(self):
+        return tuple(self._children)
+
+    @property
+    def children_recursive(self):
+        result = []
+        stack = list(reversed(self._children))
+        while stack:
+            child = stack.pop()
+            result.append(child)
+            stack.extend(reversed(child._children))
+        return result
+
+
+class DataCollection:
+    """bpy.data.* style collection: ordered, iterable, with new/remove/get."""
+
+    def __init__(self, factory):
+        self._factory = factory
+        self._items = {}
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(list(self._items.values()))
+
+    def __getitem__(self, name):
+        return self._items[name]
+
+    def get(self, name, default=None):
+        return self._items.get(name, default)
+
+    def _unique_name(self, name):
+        if name not in self._items:
+            return name
+        n = 1
+        while "%s.%03d" % (name, n) in self._items:
+            n += 1
+        return "%s.%03d" % (name, n)
+
+    def add(self, item):
+        item.name = self._unique_name(item.name)
+        self._items[item.name] = item
+        return item
+
+    def new(self, name, *args, **kwargs):
+        return self.add(self._factory(name, *args, **kwargs))
+
+    def foreach_get(self, attr, out):
+        # Same layout as RNA, which stores matrices column by column
+        values = [np.asarray(getattr(item, attr), dtype=np.float32) for item in self._items.values()]
+        if attr == "matrix_world":
+            values = [value.T for value in values]
+        out[:] = np.concatenate([value.ravel() for value in values]) if values else ()
+
+    def remove(self, item):
+        self._items.pop(item.name, None)
+
+    def clear(self):
+        self._items.clear()
+
+
+class ObjectCollection:
+    """Collection.objects: link/unlink without creating datablocks."""
+
+    def __init__(self):
+        self._objects = []
+
+    def __len__(self):
+        return len(self._objects)
+
+    def __iter__(self):
+        return iter(list(self._objects))
+
+    def link(self, ob):
+        self._objects.append(ob)
+
+    def unlink(self, ob):
+        self._objects.remove(ob)
+
+
+class Collection(ID):
+    def __init__(self, name):
+        super().__init__(name)
+        self.objects = ObjectCollection()
+        self.children = []
+
+
+class Data:
+    def __init__(self):
+        self.objects = DataCollection(Object)
+        self.meshes = DataCollection(Mesh)
+        self.collections = DataCollection(Collection)
+        self.filepath = ""
+
+    def clear(self):
+        for collection in (self.objects, self.meshes, self.collections):
+            collection.clear()
+
+
+class Scene(ID):
+    def __init__(self, data):
+        super().__init__("Scene")
+        self._data = data
+        self.collection = Collection("Scene Collection")
+
+    @property
+    def objects(self):
+        return list(self._data.objects)
+
+
+def persistent(func):
+    return func
+
+
+def _noop(*args, **kwargs):
+    return None
+
+
+def install():
+    """Register fake bpy, bpy.* submodules and mathutils in sys.modules; return the bpy module."""
+    if "bpy" in sys.modules and getattr(sys.modules["bpy"], "IS_FAKE", False):
+        return sys.modules["bpy"]
+
+    bpy = types.ModuleType("bpy")
+    bpy.IS_FAKE = True
+    bpy.data = Data()
+    scene = Scene(bpy.data)
+    bpy.context = types.SimpleNamespace(scene=scene, collection=scene.collection, object=None,
+                                        view_layer=types.SimpleNamespace(objects=types.SimpleNamespace(active=None)))
+
+    bpy.types = types.ModuleType("bpy.types")
+    bpy.types.ID = ID
+    bpy.types.Object = Object
+    bpy.types.Mesh = Mesh
+    bpy.types.Collection = Collection
+    for name in ("Operator", "Panel", "PropertyGroup", "UIList"):
+        setattr(bpy.types, name, type(name, (), {}))
+
+    bpy.app = types.ModuleType("bpy.app")
+    bpy.app.driver_namespace = {}
+    bpy.app.handlers = types.ModuleType("bpy.app.handlers")
+    bpy.app.handlers.persistent = persistent
+    for name in ("depsgraph_update_post", "load_post", "undo_post", "redo_post"):
+        setattr(bpy.app.handlers, name, [])
+
+    bpy.props = types.ModuleType("bpy.props")
+    for name in ("BoolProperty", "IntProperty", "FloatProperty", "StringProperty", "EnumProperty",
+                 "PointerProperty", "CollectionProperty", "FloatVectorProperty"):
+        setattr(bpy.props, name, _noop)
+    bpy.utils = types.ModuleType("bpy.utils")
+    bpy.utils.register_class = _noop
+    bpy.utils.unregister_class = _noop
+
+    mathutils = types.ModuleType("mathutils")
+    mathutils.Vector = Vector
+    mathutils.Matrix = Matrix
+    mathutils.Euler = Euler
+
+    sys.modules.update({
+        "bpy": bpy,
+        "bpy.types": bpy.types,
+        "bpy.app": bpy.app,
+        "bpy.app.handlers": bpy.app.handlers,
+        "bpy.props": bpy.props,
+        "bpy.utils": bpy.utils,
+        "mathutils": mathutils,
+    })
+    return bpy
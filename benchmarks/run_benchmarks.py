@@ -0,0 +1,372 @@
+"""Time the hot paths of the answer scripts on synthetic scenes, on plain CPython.
+
+    python benchmarks/run_benchmarks.py --sizes 1000,10000,100000 --output after.json
+    python benchmarks/run_benchmarks.py --compare before.json after.json
+
+bpy and mathutils are replaced by the stand-ins in fake_bpy, so only NumPy is
+needed. Every result holds the best and median wall time over --repeat runs
+and the tracemalloc peak of one extra run. Benchmarks measured at several
+sizes also get a scaling exponent, the slope of log time over log size:
+about 1 for linear work, 2 for quadratic.
+"""
+import argparse
+import ast
+import fnmatch
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import types
+
+# Make the stand-ins importable
+bench_dir = os.path.dirname(os.path.abspath(__file__))
+repo_root = os.path.dirname(bench_dir)
+if bench_dir not in sys.path:
+    sys.path.append(bench_dir)
+
+import fake_bpy
+bpy = fake_bpy.install()
+
+import numpy as np
+
+import scenes
+
+SCRIPTS = {
+    "Q1": "Q1_DuplicateMeshObjects_&_ChangeShader/Q1_DuplicateMeshObjects_&_ChangeShader.py",
+    "Q2": "Q2_Addon_ThreePointLighter/Q2_Three_point_lighter.py",
+    "Q3": "Q3_Get_Parent_Child_Dict/Q3_Get_Parent_Child_Dict.py",
+    "Q4": "Q4_Addon_WriteToJson/Q4_Addon_WriteToJson.py",
+    "Q6": "Q6_ToFindCentreOfMeshesInHierarchy/Q6_ToFindCentreOfMeshesInHierarchy.py",
+}
+HIERARCHY_KINDS = ("flat", "wide", "deep")
+ALL_KINDS = HIERARCHY_KINDS + ("dense",)
+
+# name -> (function, scene kinds); the function gets the scene root and returns (run, teardown)
+BENCHMARKS = {}
+# Loaded scripts by name; one namespace each, so their caches live as long as in Blender
+_scripts = {}
+
+
+def benchmark(name, kinds):
+    def decorator(func):
+        BENCHMARKS[name] = (func, kinds)
+        return func
+    return decorator
+
+
+CONSTANT_NODES = (ast.Constant, ast.Tuple, ast.List, ast.Set, ast.Dict, ast.BinOp, ast.UnaryOp,
+                  ast.operator, ast.unaryop, ast.expr_context)
+
+
+def _is_literal(node):
+    # Literals and arithmetic on them, e.g. 1024 * 1024; nothing that reads bpy state
+    return all(isinstance(n, CONSTANT_NODES) for n in ast.walk(node))
+
+
+def _is_module_state(node):
+    # Assignments to private names, e.g. _local_stats = {} or _index = HierarchyIndex()
+    return all(isinstance(target, ast.Name) and target.id.startswith("_") for target in node.targets)
+
+
+def load_script(name):
+    """Execute only the imports, constants, module state, functions and plain classes of a script.
+
+    The scripts do their work at module level and the addons subclass bpy
+    types, so importing them would run Blender operations; this keeps just
+    the definitions the benchmarks call. Each script is loaded once, and its
+    depsgraph handlers are registered as its register() would.
+    """
+    if name in _scripts:
+        return _scripts[name]
+    path = os.path.join(repo_root, SCRIPTS[name])
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), path)
+    body = [node for node in tree.body
+            if isinstance(node, (ast.Import, ast.ImportFrom, ast.FunctionDef))
+            or (isinstance(node, ast.ClassDef) and not node.bases)
+            or (isinstance(node, ast.Assign) and (_is_literal(node.value) or _is_module_state(node)))]
+    namespace = {"__name__": "bench_" + name, "__file__": path}
+    exec(compile(ast.Module(body=body, type_ignores=[]), path, "exec"), namespace)
+    for value in namespace.values():
+        if getattr(value, "__name__", "").endswith("_on_depsgraph_update"):
+            bpy.app.handlers.depsgraph_update_post.append(value)
+    _scripts[name] = types.SimpleNamespace(**namespace)
+    return _scripts[name]
+
+
+def reset_caches():
+    # Forget cached mesh stats and hierarchy indexes of every loaded script
+    for script in _scripts.values():
+        for attr in ("_local_stats", "_geometry_versions", "_world_bounds", "_mesh_bounds"):
+            if hasattr(script, attr):
+                getattr(script, attr).clear()
+        if hasattr(script, "_hierarchy_index"):
+            script._hierarchy_index.dirty = True
+
+
+@benchmark("q6_center_cold", ALL_KINDS)
+def bench_center_cold(root):
+    q6 = load_script("Q6")
+
+    def run():
+        reset_caches()
+        q6.calc_center_of_meshes(root)
+    return run, None
+
+
+@benchmark("q6_center_warm", ALL_KINDS)
+def bench_center_warm(root):
+    q6 = load_script("Q6")
+    q6.calc_center_of_meshes(root)
+    return (lambda: q6.calc_center_of_meshes(root)), None
+
+
+@benchmark("q6_batch_centers", ("wide",))
+def bench_batch_centers(root):
+    q6 = load_script("Q6")
+    # Every branch plus the root, so each mesh object sits in two overlapping subtrees
+    roots = [root] + list(root.children)
+    return (lambda: q6.calc_centers_of_meshes(roots)), None
+
+
+@benchmark("q3_parent_child_dict", HIERARCHY_KINDS)
+def bench_parent_child_dict(root):
+    q3 = load_script("Q3")
+    return (lambda: q3.build_parent_child_dict(bpy.context.scene.objects, root)), None
+
+
+@benchmark("hierarchy_index_rebuild", HIERARCHY_KINDS)
+def bench_index_rebuild(root):
+    q4 = load_script("Q4")
+    return (lambda: q4._hierarchy_index.rebuild()), None
+
+
+@benchmark("q2_bounding_box", ALL_KINDS)
+def bench_bounding_box(root):
+    q2 = load_script("Q2")
+    boxes = []
+
+    def run():
+        bounds = q2.get_hierarchy_bounds(root)
+        boxes.append(q2.create_box_object("Bounds", bounds.scaled_from_base(*q2.LIGHT_DOMAIN_SCALE)))
+
+    def teardown():
+        # Keep the object count stable so the hierarchy index is not rebuilt
+        for box in boxes:
+            bpy.data.meshes.remove(box.data)
+            bpy.data.objects.remove(box)
+        boxes.clear()
+    return run, teardown
+
+
+def _q4_writer(output_format, compact=False, full_hierarchy=False):
+    def bench(root):
+        q4 = load_script("Q4")
+        selected_objects = list(bpy.data.objects)
+        directory = tempfile.mkdtemp(prefix="bench_q4_")
+        file_path = os.path.join(directory, "objects")
+
+        def run():
+            q4.write_object_info(file_path, selected_objects, output_format, compact, full_hierarchy)
+
+        def teardown():
+            if os.path.exists(file_path):
+                os.remove(file_path)
+        return run, teardown
+    return bench
+
+
+benchmark("q4_write_json", HIERARCHY_KINDS)(_q4_writer('JSON'))
+benchmark("q4_write_json_compact", HIERARCHY_KINDS)(_q4_writer('JSON', compact=True))
+benchmark("q4_write_ndjson", HIERARCHY_KINDS)(_q4_writer('NDJSON'))
+benchmark("q4_write_full_hierarchy", HIERARCHY_KINDS)(_q4_writer('JSON', full_hierarchy=True))
+benchmark("q4_write_columnar", HIERARCHY_KINDS)(_q4_writer('COLUMNAR'))
+
+
+@benchmark("q1_source_bounds", ("dense",))
+def bench_source_bounds(root):
+    q1 = load_script("Q1")
+    mesh = root.children[0].data
+
+    def run():
+        q1._mesh_bounds.clear()
+        q1.get_mesh_bounds(mesh)
+    return run, None
+
+
+def _q1_grid(share_mesh):
+    def bench(root):
+        q1 = load_script("Q1")
+        # The scene size is the number of grid cells; the source is one pooled mesh object
+        source = root.children[0]
+        side = max(1, int(math.sqrt(len(root.children))))
+        collection = bpy.data.collections.new("Grid")
+        spans = tuple(float(v) for v in np.ptp(source.data.vertices.co, axis=0))
+        created = []
+
+        def run():
+            created.extend(q1.duplicate_on_grid(source, collection, (side, side, 1), 0.3, "Grid", spans, share_mesh))
+
+        def teardown():
+            meshes = {ob.data for ob in created}
+            for ob in created:
+                bpy.data.objects.remove(ob)
+            for mesh in meshes:
+                bpy.data.meshes.remove(mesh)
+            created.clear()
+            collection.objects = fake_bpy.ObjectCollection()
+        return run, teardown
+    return bench
+
+
+benchmark("q1_grid_copies", ("flat",))(_q1_grid(share_mesh=False))
+benchmark("q1_grid_linked", ("flat",))(_q1_grid(share_mesh=True))
+
+
+def measure(run, teardown, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+        if teardown is not None:
+            teardown()
+
+    # A separate run for memory; tracemalloc slows allocation-heavy code down
+    tracemalloc.start()
+    run()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    if teardown is not None:
+        teardown()
+    return min(times), statistics.median(times), peak
+
+
+def scaling_exponents(results):
+    groups = {}
+    for result in results:
+        groups.setdefault((result["benchmark"], result["scene"]), []).append(result)
+    exponents = []
+    for (name, kind), group in sorted(groups.items()):
+        points = [(math.log(r["size"]), math.log(r["seconds_min"])) for r in group if r["seconds_min"] > 0]
+        if len(points) < 2:
+            continue
+        x, y = np.array(points).T
+        slope = np.polyfit(x, y, 1)[0]
+        exponents.append({"benchmark": name, "scene": kind, "exponent": round(float(slope), 3)})
+    return exponents
+
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], cwd=repo_root, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(patterns, sizes, dense_sizes, repeat, seed):
+    results = []
+    for kind in ALL_KINDS:
+        for size in (dense_sizes if kind == "dense" else sizes):
+            selected = [(name, func) for name, (func, kinds) in BENCHMARKS.items()
+                        if kind in kinds and any(fnmatch.fnmatch(name, p) for p in patterns)]
+            if not selected:
+                continue
+            root = scenes.build_scene(kind, size, seed)
+            reset_caches()
+            for name, func in selected:
+                run, teardown = func(root)
+                seconds_min, seconds_median, peak = measure(run, teardown, repeat)
+                result = {
+                    "benchmark": name,
+                    "scene": kind,
+                    "size": size,
+                    "seconds_min": seconds_min,
+                    "seconds_median": seconds_median,
+                    "peak_bytes": peak,
+                }
+                print("%-26s %-6s %10d %10.4fs %10.1f MiB" % (name, kind, size, seconds_min, peak / 2**20),
+                      file=sys.stderr)
+                results.append(result)
+
+    return {
+        "environment": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "git_revision": git_revision(),
+            "repeat": repeat,
+            "seed": seed,
+        },
+        "results": results,
+        "scaling": scaling_exponents(results),
+    }
+
+
+def compare(before_path, after_path):
+    # One line per result present in both files; ratios above 1 are slowdowns
+    with open(before_path) as f:
+        before = {(r["benchmark"], r["scene"], r["size"]): r for r in json.load(f)["results"]}
+    with open(after_path) as f:
+        after = json.load(f)["results"]
+    rows = []
+    for r in after:
+        old = before.get((r["benchmark"], r["scene"], r["size"]))
+        if old is None:
+            continue
+        rows.append({
+            "benchmark": r["benchmark"],
+            "scene": r["scene"],
+            "size": r["size"],
+            "time_ratio": r["seconds_min"] / old["seconds_min"] if old["seconds_min"] else None,
+            "peak_ratio": r["peak_bytes"] / old["peak_bytes"] if old["peak_bytes"] else None,
+        })
+    return rows
+
+
+def parse_sizes(text):
+    return [int(float(v)) for v in text.split(",") if v]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--benchmarks", default="*",
+                        help="comma separated name patterns, e.g. 'q6_*,q4_write_json'")
+    parser.add_argument("--sizes", default="1000,10000", type=parse_sizes,
+                        help="object counts for the flat, wide and deep scenes")
+    parser.add_argument("--dense-sizes", default="100000,1000000", type=parse_sizes,
+                        help="vertex counts for the dense scene")
+    parser.add_argument("--repeat", default=3, type=int)
+    parser.add_argument("--seed", default=0, type=int)
+    parser.add_argument("--output", help="write the JSON results here instead of stdout")
+    parser.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"),
+                        help="print time and peak memory ratios between two result files")
+    parser.add_argument("--list", action="store_true", help="list the benchmark names and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, (func, kinds) in BENCHMARKS.items():
+            print(name, ",".join(kinds))
+        return
+    if args.compare:
+        report = compare(*args.compare)
+    else:
+        report = run_benchmarks(args.benchmarks.split(","), args.sizes, args.dense_sizes, args.repeat, args.seed)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Synthetic scenes built in the fake bpy.data, sized by object or vertex count."""
+import math
+
+import numpy as np
+
+import bpy
+
+SCENE_KINDS = ("flat", "wide", "deep", "dense")
+# Objects share a pool of meshes, as instanced assets do, so 1M objects stay affordable
+MESH_POOL_SIZE = 64
+VERTICES_PER_MESH = 512
+
+
+def reset():
+    bpy.data.clear()
+    bpy.context.object = None
+
+
+def _random_matrix(rng, rotate):
+    matrix = np.identity(4)
+    matrix[:3, 3] = rng.uniform(-100, 100, 3)
+    if rotate:
+        # Rotation about Z makes the lighter's world bounds read the vertices instead of transforming the box
+        angle = rng.uniform(0, 2 * math.pi)
+        c, s = math.cos(angle), math.sin(angle)
+        matrix[:2, :2] = ((c, -s), (s, c))
+    return matrix
+
+
+def _mesh_pool(rng, count, vertices):
+    return [bpy.data.meshes.new("Mesh%d" % i, rng.uniform(-1, 1, (vertices, 3)))
+            for i in range(count)]
+
+
+def _new_object(name, mesh, parent, rng, rotate):
+    ob = bpy.data.objects.new(name, mesh)
+    ob.parent = parent
+    ob.matrix_world = _random_matrix(rng, rotate)
+    ob.location[:] = ob.matrix_world[:3, 3].tolist()
+    return ob
+
+
+def build_scene(kind, size, seed=0, rotated_fraction=0.25):
+    """Fill bpy.data with a scene of the given kind and return its root object.
+
+    flat  - size mesh objects directly under one root empty
+    wide  - a root with sqrt(size) children of sqrt(size) mesh children each
+    deep  - a single parent chain size objects long
+    dense - one object whose mesh has size vertices
+    """
+    reset()
+    rng = np.random.default_rng(seed)
+    root = bpy.data.objects.new("Root", None)
+
+    if kind == "dense":
+        mesh = bpy.data.meshes.new("Dense", rng.uniform(-1, 1, (size, 3)))
+        _new_object("Dense", mesh, root, rng, rotate=False)
+    else:
+        pool = _mesh_pool(rng, MESH_POOL_SIZE, VERTICES_PER_MESH)
+        rotated = rng.random(size) < rotated_fraction
+        if kind == "flat":
+            for i in range(size):
+                _new_object("Ob%d" % i, pool[i % len(pool)], root, rng, rotated[i])
+        elif kind == "wide":
+            branches = max(1, int(math.sqrt(size)))
+            for b in range(branches):
+                branch = _new_object("Branch%d" % b, None, root, rng, rotate=False)
+                for i in range(size // branches):
+                    n = b * branches + i
+                    _new_object("Ob%d" % n, pool[n % len(pool)], branch, rng, rotated[n])
+        elif kind == "deep":
+            parent = root
+            for i in range(size):
+                parent = _new_object("Ob%d" % i, pool[i % len(pool)], parent, rng, rotated[i])
+        else:
+            raise ValueError("Unknown scene kind: %s" % kind)
+
+    bpy.context.object = root
+    return root
@@ -0,0 +1,7 @@
+# Columnar layout: MAGIC | header length (uint64, little endian) | JSON header | padding | arrays.
+# Every array starts on a COLUMNAR_ALIGNMENT boundary so readers can memory-map it directly.
+COLUMNAR_MAGIC = b"COLSCN01"
+COLUMNAR_ALIGNMENT = 64
+
+def align_columnar_offset(offset):
+    return (offset + COLUMNAR_ALIGNMENT - 1) // COLUMNAR_ALIGNMENT * COLUMNAR_ALIGNMENT
@@ -0,0 +1,82 @@
+class HierarchyIndex:
+    """Parent and children of every object in bpy.data, kept current from depsgraph updates.
+
+    The attributes are stored in state, so a text block can pass a dict kept
+    in bpy.app.driver_namespace and keep the index across runs.
+    """
+
+    def __init__(self, state=None):
+        self.__dict__ = {} if state is None else state
+        if "parent" not in self.__dict__:
+            self.parent = {}
+            self.children = {}
+            self.dirty = True
+
+    def rebuild(self):
+        self.parent = {}
+        self.children = {}
+        for ob in bpy.data.objects:
+            self._add(ob)
+        self.dirty = False
+
+    def _add(self, ob):
+        self.parent[ob] = ob.parent
+        if ob.parent is not None:
+            self.children.setdefault(ob.parent, []).append(ob)
+
+    def _remove(self, ob):
+        parent = self.parent.pop(ob)
+        if parent is not None:
+            siblings = self.children[parent]
+            siblings.remove(ob)
+            if not siblings:
+                del self.children[parent]
+
+    def update_object(self, ob):
+        if ob in self.parent:
+            if self.parent[ob] == ob.parent:
+                return
+            self._remove(ob)
+        self._add(ob)
+
+    def update(self, depsgraph):
+        # Added and re-parented objects are reported; removed ones are not
+        if self.dirty:
+            return
+        for update in depsgraph.updates:
+            if isinstance(update.id, bpy.types.Object):
+                self.update_object(update.id.original)
+
+    def ensure(self, tracked=True):
+        # Untracked means no handler keeps the index current, so it is rebuilt for every query.
+        # A changed object count catches removals; _get_valid_children catches those the count hides.
+        if self.dirty or not tracked or len(self.parent) != len(bpy.data.objects):
+            self.rebuild()
+        return self
+
+    def _get_valid_children(self, ob):
+        # A removal paired with an unseen addition keeps the count; the removed child then raises
+        # ReferenceError, or its reused pointer reports another parent
+        children = self.children.get(ob, ())
+        try:
+            valid = all(child.parent == ob for child in children)
+        except ReferenceError:
+            valid = False
+        if not valid:
+            self.rebuild()
+            children = self.children.get(ob, ())
+        return children
+
+    def get_children(self, ob):
+        # Name order, the same after any edit history; the lists themselves follow update order
+        return sorted(self._get_valid_children(ob), key=lambda child: child.name)
+
+    def descendants(self, ob):
+        # Depth-first, same set of objects as ob.children_recursive
+        result = []
+        stack = list(reversed(self._get_valid_children(ob)))
+        while stack:
+            child = stack.pop()
+            result.append(child)
+            stack.extend(reversed(self._get_valid_children(child)))
+        return result
@@ -0,0 +1,7 @@
+def get_mesh_objects(parent_ob, descendants):
+    # parent_ob and its descendants that are meshes
+    if parent_ob.type == 'MESH':
+        yield parent_ob
+    for child in descendants:
+        if child.type == 'MESH':
+            yield child
@@ -0,0 +1,6 @@
+def get_local_mesh_verts(mesh):
+    # Read all vertex coordinates in one call
+    vertices = mesh.vertices
+    co = np.empty(len(vertices) * 3, dtype=np.float32)
+    vertices.foreach_get("co", co)
+    return co.reshape(-1, 3)
@@ -0,0 +1,130 @@
+# Opt-in operator profiling, switched on by the WindowManager property named PROFILING_PROPERTY.
+# Runs are appended to the rolling log PROFILE_LOG_NAME in Blender's user config directory.
+MAX_PROFILE_ENTRIES = 500
+# Profile of the operator currently running; nested operators are folded into it
+_active_profile = None
+# Last profile per operator, shown in the Profiling subpanel
+_last_profiles = {}
+
+class OperatorProfile:
+    """Wall time per stage, bpy.ops calls and tracemalloc peak of one operator run."""
+
+    def __init__(self, operator):
+        self.operator = operator
+        self.started = time.time()
+        self.seconds = 0.0
+        self.stages = {}
+        self.ops_calls = None
+        self.peak_bytes = 0
+        self.result = None
+
+def get_profile_log_path():
+    return os.path.join(bpy.utils.user_resource('CONFIG'), PROFILE_LOG_NAME)
+
+@contextmanager
+def profile_stage(name):
+    # Stages with the same name add up, so a stage can be entered once per file or per rig
+    profile = _active_profile
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        if profile is not None:
+            profile.stages[name] = profile.stages.get(name, 0.0) + time.perf_counter() - start
+
+def count_ops_calls(profile):
+    # bpy.ops operators are called through this class; returns a function that undoes the patch
+    op_class = getattr(bpy.ops, "_BPyOpsSubModOp", None)
+    if op_class is None:
+        return lambda: None
+    original = op_class.__call__
+
+    def counted_call(self, *args, **kwargs):
+        profile.ops_calls += 1
+        return original(self, *args, **kwargs)
+
+    profile.ops_calls = 0
+    op_class.__call__ = counted_call
+
+    def restore():
+        op_class.__call__ = original
+    return restore
+
+def finish_profile(profile, result):
+    # Shows the profile in the subpanel and appends it to the log
+    profile.result = None if result is None else sorted(result)
+    _last_profiles[profile.operator] = profile
+    path = get_profile_log_path()
+    try:
+        with open(path) as f:
+            entries = json.load(f)
+    except (OSError, ValueError):
+        entries = []
+    entries.append(vars(profile))
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(entries[-MAX_PROFILE_ENTRIES:], f, indent=1)
+    except OSError as e:
+        print(f"Could not write operator profile log {path}: {e}")
+
+def profiled(execute):
+    """Decorator for Operator.execute; records a profile when profiling is switched on.
+
+    If execute returns RUNNING_MODAL the profile is left open as self._profile;
+    the modal part adds to it and hands it to finish_profile when it is done.
+    """
+    @functools.wraps(execute)
+    def wrapper(self, context):
+        global _active_profile
+        if _active_profile is not None or not getattr(context.window_manager, PROFILING_PROPERTY, False):
+            return execute(self, context)
+
+        profile = OperatorProfile(self.bl_idname)
+        _active_profile = profile
+        restore_ops = count_ops_calls(profile)
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        else:
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+        result = None
+        try:
+            result = execute(self, context)
+            return result
+        finally:
+            profile.seconds = time.perf_counter() - start
+            profile.peak_bytes = tracemalloc.get_traced_memory()[1]
+            if started_tracing:
+                tracemalloc.stop()
+            restore_ops()
+            _active_profile = None
+            if result is not None and 'RUNNING_MODAL' in result:
+                self._profile = profile
+            else:
+                finish_profile(profile, result)
+    return wrapper
+
+def draw_profiles(layout, context):
+    layout.prop(context.window_manager, PROFILING_PROPERTY)
+    for profile in _last_profiles.values():
+        box = layout.box()
+        ops_calls = "n/a" if profile.ops_calls is None else profile.ops_calls
+        box.label(text=f"{profile.operator}: {profile.seconds:.3f}s")
+        box.label(text=f"bpy.ops calls: {ops_calls}, peak: {profile.peak_bytes / 2**20:.1f} MiB")
+        col = box.column(align=True)
+        for name, seconds in profile.stages.items():
+            col.label(text=f"{name}: {seconds:.3f}s")
+    if _last_profiles:
+        layout.label(text=f"Log: {get_profile_log_path()}")
+
+def register_profiling():
+    setattr(bpy.types.WindowManager, PROFILING_PROPERTY, bpy.props.BoolProperty(
+        name="Profile Operators",
+        description="Record stage timings, bpy.ops calls and peak memory of this addon's operators",
+        default=False,
+    ))
+
+def unregister_profiling():
+    delattr(bpy.types.WindowManager, PROFILING_PROPERTY)
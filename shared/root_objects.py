@@ -0,0 +1,11 @@
+def get_root_objects(objects):
+    # Objects that have no ancestor in the given set
+    selected = set(objects)
+    roots = []
+    for ob in objects:
+        parent = ob.parent
+        while parent is not None and parent not in selected:
+            parent = parent.parent
+        if parent is None:
+            roots.append(ob)
+    return roots
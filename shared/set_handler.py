@@ -0,0 +1,5 @@
+def set_handler(handler_list, handler):
+    # Every run of a text block defines new functions; drop the ones left by earlier runs
+    for old in [h for h in handler_list if getattr(h, "__name__", None) == handler.__name__]:
+        handler_list.remove(old)
+    handler_list.append(handler)
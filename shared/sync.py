@@ -0,0 +1,84 @@
+"""Copy the shared blocks into the scripts and addons that use them.
+
+    python shared/sync.py           # rewrite every marked block from shared/<name>.py
+    python shared/sync.py --check   # list out-of-date blocks and exit with status 1
+
+Every script and addon has to work as a single file: text blocks run from
+inside the .blend files and addons are installed as one .py file. Helpers
+that several of them need are therefore kept once in this directory and
+copied verbatim between marker lines:
+
+    # --- shared block "profiling": generated from shared/profiling.py by shared/sync.py, edit it there ---
+    ...
+    # --- end of shared block "profiling" ---
+
+Edit the file in shared/, then run this script; never edit a copy.
+"""
+import argparse
+import os
+import re
+import sys
+
+shared_dir = os.path.dirname(os.path.abspath(__file__))
+repo_root = os.path.dirname(shared_dir)
+
+BLOCK_PATTERN = re.compile(
+    r'^(# --- shared block "(?P<name>\w+)":[^\n]*\n)(?P<body>.*?)^(# --- end of shared block "(?P=name)" ---)$',
+    re.MULTILINE | re.DOTALL)
+
+
+def begin_marker(name):
+    return f'# --- shared block "{name}": generated from shared/{name}.py by shared/sync.py, edit it there ---\n'
+
+
+def read_block(name):
+    with open(os.path.join(shared_dir, name + ".py"), encoding="utf-8") as f:
+        return f.read()
+
+
+def iter_target_paths():
+    for directory, subdirectories, files in os.walk(repo_root):
+        subdirectories[:] = sorted(d for d in subdirectories if not d.startswith(".") and d != "__pycache__")
+        if os.path.samefile(directory, shared_dir):
+            continue
+        for name in sorted(files):
+            if name.endswith(".py"):
+                yield os.path.join(directory, name)
+
+
+def sync_file(path):
+    """Return the text of path with every block replaced by its shared source, and the stale block names."""
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    stale = []
+
+    def replace(match):
+        name = match.group("name")
+        block = begin_marker(name) + read_block(name)
+        if match.group(1) + match.group("body") != block:
+            stale.append(name)
+        return block + match.group(4)
+    return BLOCK_PATTERN.sub(replace, text), stale
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--check", action="store_true", help="only report out-of-date blocks")
+    args = parser.parse_args(argv)
+
+    out_of_date = False
+    for path in iter_target_paths():
+        text, stale = sync_file(path)
+        if not stale:
+            continue
+        out_of_date = True
+        print("%s: %s" % (os.path.relpath(path, repo_root), ", ".join(stale)))
+        if not args.check:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text)
+    if args.check and out_of_date:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+# Floats per object of every transform attribute read_transforms can bulk-read
+TRANSFORM_SIZES = {"matrix_world": 16, "location": 3, "rotation_euler": 3, "scale": 3}
+# Up to this many objects, reading them one by one is cheaper than a pass over bpy.data.objects
+PER_OBJECT_LIMIT = 256
+
+class TransformSnapshot:
+    """Transforms of every object in bpy.data, read with one foreach_get per attribute on first use."""
+
+    def __init__(self):
+        self.objects = bpy.data.objects
+        self.rows = {ob: i for i, ob in enumerate(self.objects)}
+        self.arrays = {}
+
+    def read(self, attr):
+        array = self.arrays.get(attr)
+        if array is None:
+            flat = np.empty(len(self.objects) * TRANSFORM_SIZES[attr], dtype=np.float32)
+            self.objects.foreach_get(attr, flat)
+            if attr == "matrix_world":
+                # RNA stores matrices column by column
+                array = flat.reshape(-1, 4, 4).transpose(0, 2, 1)
+            else:
+                array = flat.reshape(-1, 3)
+            self.arrays[attr] = array
+        return array
+
+def read_transforms(objects, attributes, snapshot=None):
+    """Transforms of objects as float32 arrays keyed by attribute; row i belongs to objects[i].
+
+    matrix_world is (n, 4, 4) in row-major (mathutils) order, the others are
+    (n, 3). Pass a TransformSnapshot to share one read of the file between calls.
+    """
+    objects = list(objects)
+    if snapshot is None and len(objects) <= PER_OBJECT_LIMIT:
+        arrays = {}
+        for attr in attributes:
+            shape = (len(objects), 4, 4) if attr == "matrix_world" else (len(objects), 3)
+            array = np.empty(shape, dtype=np.float32)
+            for i, ob in enumerate(objects):
+                array[i] = getattr(ob, attr)
+            arrays[attr] = array
+        return arrays
+
+    if snapshot is None:
+        snapshot = TransformSnapshot()
+    rows = np.fromiter((snapshot.rows[ob] for ob in objects), dtype=np.intp, count=len(objects))
+    return {attr: snapshot.read(attr)[rows] for attr in attributes}